@@ -1,45 +1,96 @@
+import os
 import pygame
-from settings import PLAYER_SIZE, ENEMY_SIZE, BULLET_SIZE
+from text_cache import fonts
+from sprite_atlas import SpriteAtlas
+from powerup_system import PowerUp
+from settings import PLAYER_SIZE, ENEMY_SIZE, BULLET_SIZE, FONT_SIZE_HUD, FONT_SIZE_GAME_OVER, FONT_SIZE_SMALL
+
+# Asset files live next to this module, wherever the game is started from
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def asset_path(filename):
+    """Get the absolute path of an asset file"""
+    return os.path.join(ASSET_DIR, filename)
 
 class Assets:
     def __init__(self):
+        self.images = {}  # filename -> decoded, display-format source image
+        self.scaled_images = {}  # (filename, size, smooth) -> scaled variant
         self.background = None
+        self.background_strip = None
         self.player_img = None
         self.enemy_img = None
         self.bullet_img = None
         self.icon = None
+        self.atlas = SpriteAtlas()  # Every sprite packed into one surface
         self.font_hud = None
         self.font_game_over = None
         self.font_small = None
         
     def load_all(self):
-        """Load all game assets"""
-        # Load images
-        self.background = pygame.image.load("bg.jpg")
+        """Load all game assets (the display mode must already be set)"""
+        # Load images, converted to the display format so blits need no per-pixel conversion
+        self.background = self.load_image("bg.jpg", alpha=False)
+        self.background_strip = self._build_scroll_strip(self.background)
+        
+        # Pack the scaled sprites and every pre-rendered power-up into the atlas
+        PowerUp.warm_sprite_cache()
+        sprites = {
+            "player": self.get_scaled("ufo.png", PLAYER_SIZE),
+            "enemy": self.get_scaled("aircraft.png", ENEMY_SIZE),
+            "bullet": self.get_scaled("bullet.png", BULLET_SIZE)
+        }
+        for (powerup_type, size), sprite in PowerUp.sprite_cache.items():
+            sprites[PowerUp.sprite_name(powerup_type, size)] = sprite
+        self.atlas.pack(sprites)
+        
+        # Single sprites are views into the atlas
+        self.player_img = self.atlas.subsurface("player")
+        self.enemy_img = self.atlas.subsurface("enemy")
+        self.bullet_img = self.atlas.subsurface("bullet")
         
-        # Load and scale player image
-        self.player_img = pygame.image.load('ufo.png')
-        self.player_img = pygame.transform.scale(self.player_img, PLAYER_SIZE)
+        # Load icon (handed to SDL as is, so no conversion)
+        self.icon = pygame.image.load(asset_path("spaceship.png"))
         
-        # Load and scale enemy image
-        self.enemy_img = pygame.image.load('aircraft.png')
-        self.enemy_img = pygame.transform.scale(self.enemy_img, ENEMY_SIZE)
+        # Load fonts (shared with the text cache)
+        self.font_hud = fonts.get(FONT_SIZE_HUD)
+        self.font_game_over = fonts.get(FONT_SIZE_GAME_OVER)
+        self.font_small = fonts.get(FONT_SIZE_SMALL)
         
-        # Load and scale bullet image
-        self.bullet_img = pygame.image.load('bullet.png')
-        self.bullet_img = pygame.transform.scale(self.bullet_img, BULLET_SIZE)
+    def load_image(self, filename, alpha=True):
+        """Load an image once and convert it to the display format"""
+        image = self.images.get(filename)
+        if image is None:
+            image = pygame.image.load(asset_path(filename))
+            image = image.convert_alpha() if alpha else image.convert()
+            self.images[filename] = image
+        return image
         
-        # Load icon
-        self.icon = pygame.image.load("spaceship.png")
+    def get_scaled(self, filename, size, smooth=False):
+        """Get an image scaled to size, cached so each variant is only scaled once"""
+        key = (filename, tuple(size), smooth)
+        image = self.scaled_images.get(key)
+        if image is None:
+            source = self.load_image(filename)
+            scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+            image = scale(source, key[1])
+            self.scaled_images[key] = image
+        return image
         
-        # Load fonts
-        self.font_hud = pygame.font.Font(None, 24)
-        self.font_game_over = pygame.font.Font(None, 64)
-        self.font_small = pygame.font.Font(None, 36)
+    def _build_scroll_strip(self, image):
+        """Stack the background twice so any scroll offset is covered by one blit"""
+        width, height = image.get_size()
+        strip = pygame.Surface((width, height * 2)).convert()
+        strip.blit(image, (0, 0))
+        strip.blit(image, (0, height))
+        return strip
         
     def get_background(self):
         return self.background
         
+    def get_background_strip(self):
+        return self.background_strip
+        
     def get_player_img(self):
         return self.player_img
         
@@ -49,5 +100,12 @@ class Assets:
     def get_bullet_img(self):
         return self.bullet_img
         
+    def get_atlas(self):
+        return self.atlas
+        
+    def get_sprite_rect(self, name):
+        """Get a named sprite's area within the atlas surface"""
+        return self.atlas.get_rect(name)
+        
     def get_icon(self):
         return self.icon
\ No newline at end of file
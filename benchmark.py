@@ -0,0 +1,194 @@
+# Seeded headless benchmark of Game update and draw throughput
+# Each scenario builds a game in a controlled stress state, keeps it topped up every tick
+# and writes per-tick timing percentiles to a JSON report
+# Usage: python benchmark.py [--ticks N] [--seed S] [--output PATH] [--scenario NAME ...]
+
+import argparse
+import json
+import platform
+import random
+import time
+import numpy as np
+import pygame
+import game as game_module
+from game import Game
+from frame_profiler import FrameProfiler
+from game_states import GameState
+from combo_system import ParticleSystem
+from collision import find_enemy_enemy_pairs
+from enemy_engine import PATTERN_FIELDS
+from powerup_system import PowerUp, PowerUpType
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, SIMULATION_HZ, PARTICLE_CAPACITY, BULLET_SPEED
+
+MOVEMENT_TYPES = list(PATTERN_FIELDS)
+GRID_SPACING = 50  # Enemy placement grid, wider than the ship collision distance
+GRID_COLUMNS = SCREEN_WIDTH // GRID_SPACING
+POWERUP_XS = (40, 130, 220, 480, 570, 660, 750)  # Clear of the player's column, so none are collected
+PARTICLE_COLORS = ((255, 255, 0), (255, 150, 0), (100, 150, 255), (255, 0, 0))
+
+# Entities kept alive throughout each scenario
+SCENARIOS = {
+    "baseline": {},
+    "enemies_100": {"enemies": 100},
+    "enemies_200": {"enemies": 200},
+    "enemy_bullets_2000": {"enemy_bullets": 2000},
+    "particles_5000": {"particles": 5000},
+    "powerups_all": {"powerups": True},
+    "combined": {"enemies": 200, "enemy_bullets": 2000, "particles": 5000, "powerups": True},
+}
+
+def grid_position(slot, count):
+    """Get the spawn position of the slot-th enemy placed in a scenario keeping count enemies alive
+    
+    The first count fill grid rows upwards from mid-screen; replacements cycle through twelve rows
+    above those, so enemies start apart. Chain kills are off in every scenario, so replacements
+    are only needed for enemies that ram the player; enemies_spawned reports them.
+    """
+    row = slot // GRID_COLUMNS
+    if slot >= count:
+        row = count // GRID_COLUMNS + row % 12
+    return GRID_SPACING // 2 + (slot % GRID_COLUMNS) * GRID_SPACING, SCREEN_HEIGHT // 2 - row * GRID_SPACING
+
+def top_up(game, config, rng, spawned):
+    """Replace whatever the last tick destroyed so the scenario load stays constant
+    
+    spawned counts the scenario's enemies placed so far; returns the updated count.
+    """
+    current_time = game.game_clock.get_time()
+    
+    # Enemies cycle through every movement pattern
+    spawner = game.enemy_spawner
+    count = config.get("enemies", 0)
+    for _ in range(len(spawner.get_enemies()), count):
+        x, y = grid_position(spawned, count)
+        spawner.spawn_enemy_at_position(x, y, movement_type=MOVEMENT_TYPES[spawned % len(MOVEMENT_TYPES)])
+        spawned += 1
+        
+    enemy_bullets = game.bullet_manager.enemy_bullets
+    missing = config.get("enemy_bullets", 0) - enemy_bullets.active_count
+    if missing > 0:
+        xs = rng.uniform(0, SCREEN_WIDTH, missing).tolist()
+        ys = rng.uniform(1, SCREEN_HEIGHT - 1, missing).tolist()
+        speeds = rng.uniform(0.25, 1.0, missing) * BULLET_SPEED
+        for x, y, speed in zip(xs, ys, speeds.tolist()):
+            game.bullet_manager.fire_enemy_bullet(x, y, speed)
+            
+    particles = game.particle_system
+    while particles.get_count() < config.get("particles", 0):
+        color = PARTICLE_COLORS[int(rng.integers(len(PARTICLE_COLORS)))]
+        particles.add_explosion(float(rng.uniform(0, SCREEN_WIDTH)), float(rng.uniform(0, SCREEN_HEIGHT)), color, 50)
+        
+    if config.get("powerups"):
+        on_screen = {powerup.type for powerup in game.powerup_manager.powerups}
+        for powerup_type, x in zip(PowerUpType, POWERUP_XS):
+            if powerup_type not in on_screen:
+                game.powerup_manager.powerups.append(PowerUp(x, 100, powerup_type, current_time))
+    return spawned
+
+def sweep_without_kills(positions):
+    """Run the enemy-enemy sweep but report no colliding pairs, so scenario enemies never chain-kill"""
+    find_enemy_enemy_pairs(positions)
+    return []
+
+def summarize(samples):
+    """Get mean and percentiles (ms) of per-tick samples"""
+    values = np.array(samples)
+    p50, p95, p99 = np.percentile(values, (50, 95, 99))
+    return {"mean": float(values.mean()), "p50": float(p50), "p95": float(p95), "p99": float(p99),
+            "max": float(values.max())}
+
+def run_scenario(name, config, ticks, warmup, seed):
+    """Run one scenario in a fresh game; returns its report"""
+    random.seed(seed)  # The game seeds its own NumPy generators from this
+    rng = np.random.default_rng(seed)  # Scenario placement, separate from the game's RNG
+    
+    game = Game(headless=True)
+    particle_count = config.get("particles", 0)
+    if particle_count > PARTICLE_CAPACITY:
+        game.particle_system = ParticleSystem(capacity=particle_count)
+    game.reset_game()
+    game.lives = 10 ** 9  # Never reach game over mid-run
+    game.profiler = FrameProfiler(history=ticks)  # Keeps every measured tick's phase timings
+    
+    step = 1000 / SIMULATION_HZ
+    update_ms, draw_ms = [], []
+    spawned = 0
+    for tick in range(warmup + ticks):
+        spawned = top_up(game, config, rng, spawned)
+        pygame.event.pump()
+        
+        game.game_clock.tick(step)
+        start = time.perf_counter()
+        game.update(step)
+        updated = time.perf_counter()
+        game.draw()
+        drawn = time.perf_counter()
+        
+        if tick == warmup - 1:
+            game.profiler.clear()
+        elif tick >= warmup:
+            update_ms.append((updated - start) * 1000)
+            draw_ms.append((drawn - updated) * 1000)
+            
+    if game.state != GameState.PLAYING:
+        raise RuntimeError(f"Scenario {name} left the playing state")
+        
+    update_stats = summarize(update_ms)
+    draw_stats = summarize(draw_ms)
+    report = {
+        "config": config,
+        "ticks": ticks,
+        "update_ms": update_stats,
+        "draw_ms": draw_stats,
+        "frame_ms": summarize(np.add(update_ms, draw_ms)),
+        "ticks_per_second": 1000 / update_stats["mean"],
+        "frames_per_second": 1000 / draw_stats["mean"],
+        "phases_ms": game.profiler.get_stats(),
+        "enemies_spawned": spawned,
+        "final_entities": {
+            "enemies": len(game.enemy_spawner.get_enemies()),
+            "enemy_bullets": game.bullet_manager.enemy_bullets.active_count,
+            "particles": game.particle_system.get_count(),
+            "powerups": len(game.powerup_manager.powerups)
+        }
+    }
+    pygame.quit()
+    return report
+
+def run_benchmark(scenarios, ticks, warmup, seed):
+    """Run the named scenarios; returns the full report"""
+    results = {}
+    # Converging patterns would otherwise chain-kill the scenario enemies; the sweep itself is still timed
+    game_module.find_enemy_enemy_pairs = sweep_without_kills
+    try:
+        for name in scenarios:
+            results[name] = report = run_scenario(name, SCENARIOS[name], ticks, warmup, seed)
+            print(f"{name:<20} update p50 {report['update_ms']['p50']:6.2f} p95 {report['update_ms']['p95']:6.2f} ms   "
+                  f"draw p50 {report['draw_ms']['p50']:6.2f} p95 {report['draw_ms']['p95']:6.2f} ms   "
+                  f"{report['ticks_per_second']:6.0f} ticks/s {report['frames_per_second']:6.0f} fps")
+    finally:
+        game_module.find_enemy_enemy_pairs = find_enemy_enemy_pairs
+    return {
+        "seed": seed,
+        "ticks": ticks,
+        "warmup": warmup,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "scenarios": results
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless Space Invaders performance benchmark")
+    parser.add_argument("--ticks", type=int, default=600, help="measured ticks per scenario (default: 600)")
+    parser.add_argument("--warmup", type=int, default=60, help="unmeasured ticks before measuring (default: 60)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed (default: 1)")
+    parser.add_argument("--output", default="benchmark_report.json", help="JSON report path")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS),
+                        help="scenario to run, repeatable (default: all)")
+    args = parser.parse_args()
+    
+    report = run_benchmark(args.scenario or list(SCENARIOS), args.ticks, args.warmup, args.seed)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.output}")
\ No newline at end of file
@@ -1,100 +1,199 @@
-import pygame
-from settings import BULLET_SPEED, SCREEN_HEIGHT
+import numpy as np
+from settings import BULLET_SPEED, SCREEN_HEIGHT, PLAYER_BULLET_CAPACITY, ENEMY_BULLET_CAPACITY
 
 class Bullet:
-    def __init__(self, x, y, direction=1, speed=None):
+    def __init__(self, pool, index):
         """
-        Initialize bullet
-        direction: 1 for up (player bullet), -1 for down (enemy bullet)
+        Handle to one slot of a BulletPool
+        The bullet's state lives in the pool arrays; handles are created once per slot
         """
-        self.x = x
-        self.y = y
-        self.direction = direction  # 1 = up, -1 = down
-        self.speed = speed if speed else BULLET_SPEED
-        self.active = True
+        self.pool = pool
+        self.index = index
+        
+    @property
+    def x(self):
+        return float(self.pool.x[self.index])
+        
+    @property
+    def y(self):
+        return float(self.pool.y[self.index])
+        
+    @property
+    def direction(self):
+        return int(self.pool.direction[self.index])  # 1 = up, -1 = down
         
-    def update(self, delta_time):
-        """Update bullet position"""
-        if self.active:
-            # Normalize delta_time to 60 FPS (delta_time is in milliseconds)
-            normalized_delta = delta_time / 16.67  # 16.67ms = 1/60th second
-            self.y -= self.direction * self.speed * normalized_delta
-            
-            # Remove bullet if it goes off screen
-            if self.y <= 0 or self.y >= SCREEN_HEIGHT:
-                self.active = False
-                
-    def draw(self, screen, assets):
-        """Draw bullet on screen"""
-        if self.active:
-            if self.direction == 1:  # Player bullet
-                screen.blit(assets.get_bullet_img(), (self.x + 15, self.y + 10))
-            else:  # Enemy bullet
-                screen.blit(assets.get_bullet_img(), (self.x + 22, self.y + 40))
-                
     def get_position(self):
         """Get bullet position"""
-        return self.x, self.y
+        return float(self.pool.x[self.index]), float(self.pool.y[self.index])
         
     def is_active(self):
         """Check if bullet is still active"""
-        return self.active
+        return bool(self.pool.active[self.index])
         
     def deactivate(self):
-        """Deactivate the bullet"""
-        self.active = False
+        """Deactivate the bullet and return its slot to the pool"""
+        self.pool.release(self.index)
+
+class BulletView:
+    def __init__(self, pool, indices):
+        """Read-only view of the active bullets in a pool, in firing order"""
+        self.pool = pool
+        self.indices = indices
+        
+    def __len__(self):
+        return len(self.indices)
+        
+    def __iter__(self):
+        handles = self.pool.handles
+        for index in self.indices.tolist():
+            yield handles[index]
+            
+    def __getitem__(self, i):
+        return self.pool.handles[int(self.indices[i])]
+        
+    def positions(self):
+        """Get an (N, 2) array of bullet positions"""
+        return np.column_stack((self.pool.x[self.indices], self.pool.y[self.indices]))
+
+class BulletPool:
+    def __init__(self, capacity, direction, draw_offset):
+        """
+        Preallocated structure-of-arrays bullet storage with a free list
+        direction: 1 for up (player bullets), -1 for down (enemy bullets)
+        """
+        self.default_direction = direction
+        self.draw_offset = draw_offset  # Sprite offset from the bullet position
+        self.capacity = 0
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.prev_y = np.zeros(0)  # Position at the previous simulation step (for interpolation)
+        self.speed = np.zeros(0)
+        self.direction = np.zeros(0)
+        self.active = np.zeros(0, dtype=bool)
+        self.serial = np.zeros(0, dtype=np.int64)  # Firing order, so views keep list semantics
+        self.next_serial = 0
+        self.handles = []
+        self.free = []  # Stack of free slot indices
+        self.active_count = 0
+        self._grow(capacity)
+        
+    def _grow(self, capacity):
+        """Enlarge the arrays, keeping existing bullets in place"""
+        old_capacity = self.capacity
+        extra = capacity - old_capacity
+        self.x = np.concatenate((self.x, np.zeros(extra)))
+        self.y = np.concatenate((self.y, np.zeros(extra)))
+        self.prev_y = np.concatenate((self.prev_y, np.zeros(extra)))
+        self.speed = np.concatenate((self.speed, np.zeros(extra)))
+        self.direction = np.concatenate((self.direction, np.full(extra, float(self.default_direction))))
+        self.active = np.concatenate((self.active, np.zeros(extra, dtype=bool)))
+        self.serial = np.concatenate((self.serial, np.zeros(extra, dtype=np.int64)))
+        self.handles.extend(Bullet(self, i) for i in range(old_capacity, capacity))
+        
+        # Lowest free index is reused first
+        self.free = list(range(capacity - 1, old_capacity - 1, -1)) + self.free
+        self.capacity = capacity
+        
+    def spawn(self, x, y, speed):
+        """Activate a free slot; the pool doubles in size when full"""
+        if not self.free:
+            self._grow(self.capacity * 2)
+            
+        index = self.free.pop()
+        self.x[index] = x
+        self.y[index] = y
+        self.prev_y[index] = y
+        self.speed[index] = speed
+        self.direction[index] = self.default_direction
+        self.active[index] = True
+        self.serial[index] = self.next_serial
+        self.next_serial += 1
+        self.active_count += 1
+        return self.handles[index]
+        
+    def release(self, index):
+        """Deactivate a slot and return it to the free list"""
+        if self.active[index]:
+            self.active[index] = False
+            self.free.append(index)
+            self.active_count -= 1
+            
+    def update(self, delta_time):
+        """Integrate all bullets and deactivate those that left the screen"""
+        if not self.active_count:
+            return
+            
+        # Normalize delta_time to 60 FPS (delta_time is in milliseconds)
+        normalized_delta = delta_time / 16.67  # 16.67ms = 1/60th second
+        active = self.active
+        self.prev_y[active] = self.y[active]
+        self.y[active] -= self.direction[active] * self.speed[active] * normalized_delta
+        
+        # Remove bullets that went off screen
+        off_screen = np.flatnonzero(active & ((self.y <= 0) | (self.y >= SCREEN_HEIGHT)))
+        if len(off_screen):
+            active[off_screen] = False
+            self.free.extend(off_screen.tolist())
+            self.active_count -= len(off_screen)
+            
+    def view(self):
+        """Get a view of the active bullets in firing order"""
+        indices = np.flatnonzero(self.active)
+        if len(indices) > 1:
+            indices = indices[np.argsort(self.serial[indices], kind="stable")]
+        return BulletView(self, indices)
+        
+    def draw(self, screen, atlas, area, alpha=1.0):
+        """Draw all active bullets in one blits call, interpolated between simulation steps"""
+        if not self.active_count:
+            return
+            
+        indices = np.flatnonzero(self.active)
+        offset_x, offset_y = self.draw_offset
+        xs = self.x[indices] + offset_x
+        ys = self.prev_y[indices] + (self.y[indices] - self.prev_y[indices]) * alpha + offset_y
+        screen.blits([(atlas, position, area) for position in zip(xs.tolist(), ys.tolist())], False)
+        
+    def clear(self):
+        """Deactivate every bullet"""
+        self.active[:] = False
+        self.free = list(range(self.capacity - 1, -1, -1))
+        self.active_count = 0
 
 class BulletManager:
     def __init__(self):
-        self.player_bullets = []  # Changed to support multiple bullets
-        self.enemy_bullets = []
-        self.max_player_bullets = 5  # Limit for performance
+        # Preallocated pools; they grow on demand, so there is no bullet cap
+        self.player_bullets = BulletPool(PLAYER_BULLET_CAPACITY, direction=1, draw_offset=(15, 10))
+        self.enemy_bullets = BulletPool(ENEMY_BULLET_CAPACITY, direction=-1, draw_offset=(22, 40))
         
     def fire_player_bullet(self, x, y):
         """Fire a player bullet"""
-        if len(self.player_bullets) < self.max_player_bullets:
-            bullet = Bullet(x, y, direction=1)
-            self.player_bullets.append(bullet)
-            return True
-        return False
+        self.player_bullets.spawn(x, y, BULLET_SPEED)
+        return True
         
     def fire_enemy_bullet(self, x, y, speed=None):
         """Fire an enemy bullet"""
-        bullet = Bullet(x, y, direction=-1, speed=speed)
-        self.enemy_bullets.append(bullet)
+        self.enemy_bullets.spawn(x, y, speed if speed else BULLET_SPEED)
         
     def update(self, delta_time):
         """Update all bullets"""
-        # Update player bullets
-        for bullet in self.player_bullets[:]:
-            bullet.update(delta_time)
-            if not bullet.is_active():
-                self.player_bullets.remove(bullet)
-            
-        # Update enemy bullets
-        for bullet in self.enemy_bullets[:]:  # Use slice to avoid modification during iteration
-            bullet.update(delta_time)
-            if not bullet.is_active():
-                self.enemy_bullets.remove(bullet)
-                
-    def draw(self, screen, assets):
-        """Draw all bullets"""
-        # Draw player bullets
-        for bullet in self.player_bullets:
-            if bullet.is_active():
-                bullet.draw(screen, assets)
-            
-        # Draw enemy bullets
-        for bullet in self.enemy_bullets:
-            bullet.draw(screen, assets)
-            
+        self.player_bullets.update(delta_time)
+        self.enemy_bullets.update(delta_time)
+        
+    def draw(self, screen, assets, alpha=1.0):
+        """Draw all bullets from the sprite atlas"""
+        atlas = assets.get_atlas()
+        area = atlas.get_rect("bullet")
+        self.player_bullets.draw(screen, atlas.surface, area, alpha)
+        self.enemy_bullets.draw(screen, atlas.surface, area, alpha)
+        
     def get_player_bullets(self):
-        """Get all active player bullets"""
-        return [bullet for bullet in self.player_bullets if bullet.is_active()]
+        """Get a view of all active player bullets"""
+        return self.player_bullets.view()
         
     def get_enemy_bullets(self):
-        """Get all active enemy bullets"""
-        return [bullet for bullet in self.enemy_bullets if bullet.is_active()]
+        """Get a view of all active enemy bullets"""
+        return self.enemy_bullets.view()
         
     def clear_all(self):
         """Clear all bullets"""
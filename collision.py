@@ -1,9 +1,120 @@
 import math
+import numpy as np
 from settings import (
     COLLISION_THRESHOLD_BULLET, COLLISION_THRESHOLD_SHIP, 
     COLLISION_THRESHOLD_PLAYER_BULLET, DODGE_DISTANCE_MIN, DODGE_DISTANCE_MAX
 )
 
+# Broadphase cell size: the largest collision distance, so any colliding pair
+# is always in the same or an adjacent cell
+COLLISION_CELL_SIZE = max(COLLISION_THRESHOLD_BULLET, COLLISION_THRESHOLD_SHIP,
+                          COLLISION_THRESHOLD_PLAYER_BULLET)
+
+# Narrowphase candidates tested since the profiler last reset them
+collision_counters = {"pair_tests": 0}
+
+class SpatialHash:
+    """Uniform-grid broadphase, rebuilt once per frame"""
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> list of (insertion order, object)
+        self.entries = {}  # object -> (cell key, entry) so objects can be removed mid-frame
+        self.count = 0
+        
+    def clear(self):
+        """Remove all objects"""
+        self.cells.clear()
+        self.entries.clear()
+        self.count = 0
+        
+    def _cell(self, x, y):
+        """Get the grid cell containing a position"""
+        return int(x // self.cell_size), int(y // self.cell_size)
+        
+    def insert(self, obj, x, y):
+        """Add an object at a position"""
+        key = self._cell(x, y)
+        entry = (self.count, obj)
+        self.count += 1
+        self.cells.setdefault(key, []).append(entry)
+        self.entries[obj] = (key, entry)
+        
+    def remove(self, obj):
+        """Remove an object (e.g. an enemy destroyed earlier in the frame)"""
+        if obj in self.entries:
+            key, entry = self.entries.pop(obj)
+            self.cells[key].remove(entry)
+            
+    def rebuild(self, objects, positions):
+        """Rebuild the grid from parallel lists of objects and (x, y) positions"""
+        self.clear()
+        for obj, (x, y) in zip(objects, positions):
+            self.insert(obj, x, y)
+            
+    def contains(self, obj):
+        """Check if an object is still in the grid"""
+        return obj in self.entries
+        
+    def order_of(self, obj):
+        """Get the insertion order of an object"""
+        return self.entries[obj][1][0]
+        
+    def query(self, x, y, radius):
+        """Get objects in every cell overlapping the square around (x, y), in insertion order"""
+        if not self.entries:
+            return []
+            
+        cell_size = self.cell_size
+        min_cx, max_cx = int((x - radius) // cell_size), int((x + radius) // cell_size)
+        min_cy, max_cy = int((y - radius) // cell_size), int((y + radius) // cell_size)
+        
+        cells = self.cells
+        found = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found += bucket
+                    
+        collision_counters["pair_tests"] += len(found)
+        if len(found) > 1:
+            found.sort()  # Insertion order is unique, so objects are never compared
+        return [obj for _, obj in found]
+
+class NeighborIndex:
+    """Positions sorted along x with prefix sums, for horizontal range queries; rebuilt once per frame"""
+    def __init__(self):
+        self.xs = np.zeros(0)
+        self.prefix = np.zeros(1)  # prefix[i] = sum of the first i sorted positions
+        self.objects = []
+        
+    def __len__(self):
+        return len(self.xs)
+        
+    def rebuild(self, xs, objects=None):
+        """Index positions (and optionally the objects at them)"""
+        xs = np.asarray(xs, dtype=float)
+        order = np.argsort(xs, kind="stable")
+        self.xs = xs[order]
+        self.prefix = np.concatenate(([0.0], np.cumsum(self.xs)))
+        self.objects = [objects[i] for i in order.tolist()] if objects is not None else []
+        
+    def window(self, x, distance):
+        """Get the sorted-index range [lo, hi) of positions strictly within distance of x (x may be an array)"""
+        lo = np.searchsorted(self.xs, np.subtract(x, distance), side="right")
+        hi = np.searchsorted(self.xs, np.add(x, distance), side="left")
+        return lo, hi
+        
+    def count_and_sum(self, x, distance):
+        """Get the number and the sum of positions strictly within distance of x"""
+        lo, hi = self.window(x, distance)
+        return hi - lo, self.prefix[hi] - self.prefix[lo]
+        
+    def nearby(self, x, distance):
+        """Get the objects strictly within distance of x, ordered by position"""
+        lo, hi = self.window(x, distance)
+        return self.objects[lo:hi]
+
 def is_collision(x1, y1, x2, y2, threshold=COLLISION_THRESHOLD_BULLET):
     """Check if two objects are colliding based on distance"""
     distance = math.sqrt((x1 - x2)**2 + (y1 - y2)**2)
@@ -62,4 +173,69 @@ def check_dodge_bonus(bullet, player):
     if DODGE_DISTANCE_MIN < distance < DODGE_DISTANCE_MAX:
         return True, distance
     
-    return False, distance
\ No newline at end of file
+    return False, distance
+
+def find_bullet_enemy_hits(bullet_positions, enemy_positions, threshold=COLLISION_THRESHOLD_BULLET):
+    """Find all bullet/enemy hits in one vectorized pass.
+    
+    Positions are (N, 2) arrays. Each bullet hits the first enemy (in array order) it
+    overlaps and each enemy can only be hit once, like the scalar loop in Game.
+    Returns a list of (bullet_index, enemy_index) pairs in bullet order.
+    """
+    if len(bullet_positions) == 0 or len(enemy_positions) == 0:
+        return []
+        
+    # Squared distances avoid a sqrt per pair
+    collision_counters["pair_tests"] += len(bullet_positions) * len(enemy_positions)
+    dx = bullet_positions[:, 0, None] - enemy_positions[None, :, 0]
+    dy = bullet_positions[:, 1, None] - enemy_positions[None, :, 1]
+    overlaps = dx * dx + dy * dy < threshold * threshold
+    
+    hits = []
+    taken = np.zeros(len(enemy_positions), dtype=bool)
+    for bullet_index in np.flatnonzero(overlaps.any(axis=1)):
+        candidates = overlaps[bullet_index] & ~taken
+        if candidates.any():
+            enemy_index = int(candidates.argmax())  # First-hit-wins
+            taken[enemy_index] = True
+            hits.append((int(bullet_index), enemy_index))
+    return hits
+
+def find_bullets_near_point(bullet_positions, x, y, radius=COLLISION_THRESHOLD_PLAYER_BULLET):
+    """Get indices (in array order) of bullets strictly within radius of a point"""
+    if len(bullet_positions) == 0:
+        return np.empty(0, dtype=np.intp)
+        
+    collision_counters["pair_tests"] += len(bullet_positions)
+    dx = bullet_positions[:, 0] - x
+    dy = bullet_positions[:, 1] - y
+    return np.flatnonzero(dx * dx + dy * dy < radius * radius)
+
+def find_enemy_enemy_pairs(positions, threshold=COLLISION_THRESHOLD_SHIP):
+    """Find every pair of positions closer than threshold with sweep-and-prune.
+    
+    Positions are (x, y) tuples. Objects are swept in x order, keeping a window of
+    those whose x extent still overlaps, so only nearby pairs get a distance test.
+    Returns (i, j) index pairs with i < j, sorted like a nested i/j loop.
+    """
+    xs = [x for x, _ in positions]
+    order = sorted(range(len(positions)), key=xs.__getitem__)
+    threshold_sq = threshold * threshold
+    
+    pairs = []
+    window_start = 0  # First entry of order still within threshold of the sweep line
+    for k, i in enumerate(order):
+        x, y = positions[i]
+        while xs[order[window_start]] <= x - threshold:
+            window_start += 1
+        collision_counters["pair_tests"] += k - window_start
+        for w in range(window_start, k):
+            j = order[w]
+            other_x, other_y = positions[j]
+            dx = x - other_x
+            dy = y - other_y
+            if dx * dx + dy * dy < threshold_sq:
+                pairs.append((j, i) if j < i else (i, j))
+                
+    pairs.sort()
+    return pairs
\ No newline at end of file
@@ -1,5 +1,9 @@
 import pygame
 import math
+import random
+import numpy as np
+from text_cache import text_cache
+from settings import PARTICLE_CAPACITY, PARTICLE_ALPHA_BUCKETS, FONT_SIZE_HUD
 
 class ComboSystem:
     def __init__(self):
@@ -66,14 +70,14 @@ class ComboSystem:
         """Get the current score multiplier"""
         return self.multiplier
         
-    def get_combo_info(self):
+    def get_combo_info(self, current_time):
         """Get combo information for display"""
         return {
             "multiplier": self.multiplier,
             "combo_count": self.combo_count,
             "is_active": self.combo_count >= self.combo_threshold,
             "flash": self.combo_flash,
-            "time_left": max(0, self.combo_window - (pygame.time.get_ticks() - self.last_kill_time)) if self.combo_count > 0 else 0
+            "time_left": max(0, self.combo_window - (current_time - self.last_kill_time)) if self.combo_count > 0 else 0
         }
         
     def apply_multiplier(self, base_score):
@@ -81,85 +85,126 @@ class ComboSystem:
         return int(base_score * self.multiplier)
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        """
+        Explosion particles in preallocated arrays used as a ring buffer
+        When full, new particles overwrite the oldest ones
+        """
+        self.capacity = capacity
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity)  # Slots with life <= 0 are free
+        self.decay = np.zeros(capacity)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.head = 0  # Next slot to write; always the oldest particle
+        
+        # Score popups carry text, so they live in a separate small store
+        self.popups = []
+        
+        # Pre-rendered circles keyed by (color, size, alpha bucket)
+        self.sprite_cache = {}
+        
+        # Seeded from the game's RNG so seeded runs stay reproducible
+        self.rng = np.random.default_rng(random.getrandbits(32))
         
     def add_explosion(self, x, y, color=(255, 255, 0), count=8):
         """Add explosion particles at position"""
-        import random
-        for _ in range(count):
-            particle = {
-                'x': x,
-                'y': y,
-                'vx': random.uniform(-3, 3),
-                'vy': random.uniform(-3, 3),
-                'life': 1.0,
-                'decay': random.uniform(0.02, 0.04),
-                'color': color,
-                'size': random.randint(2, 4)
-            }
-            self.particles.append(particle)
-            
+        count = min(count, self.capacity)
+        slots = (self.head + np.arange(count)) % self.capacity
+        self.head = (self.head + count) % self.capacity
+        
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = self.rng.uniform(-3, 3, count)
+        self.vy[slots] = self.rng.uniform(-3, 3, count)
+        self.life[slots] = 1.0
+        self.decay[slots] = self.rng.uniform(0.02, 0.04, count)
+        self.color[slots] = color
+        self.size[slots] = self.rng.integers(2, 5, count)
+        
     def add_score_popup(self, x, y, score, multiplier=1.0):
         """Add floating score text"""
         color = (255, 255, 0) if multiplier == 1.0 else (255, 100, 100)
-        particle = {
+        popup = {
             'x': x,
             'y': y,
-            'vx': 0,
             'vy': -1,
             'life': 1.0,
             'decay': 0.015,
             'text': f"+{score}",
             'multiplier_text': f"x{multiplier:.1f}" if multiplier > 1.0 else "",
-            'color': color,
-            'type': 'score'
+            'color': color
         }
-        self.particles.append(particle)
+        self.popups.append(popup)
         
     def update(self, delta_time):
         """Update all particles"""
         normalized_delta = delta_time / 16.67
         
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx'] * normalized_delta
-            particle['y'] += particle['vy'] * normalized_delta
-            particle['life'] -= particle['decay'] * normalized_delta
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-                
-    def draw(self, screen, font=None):
+        # One vectorized step for every slot; dead slots just stay dead
+        self.x += self.vx * normalized_delta
+        self.y += self.vy * normalized_delta
+        self.life -= self.decay * normalized_delta
+        
+        for popup in self.popups:
+            popup['y'] += popup['vy'] * normalized_delta
+            popup['life'] -= popup['decay'] * normalized_delta
+        self.popups = [popup for popup in self.popups if popup['life'] > 0]
+        
+    def get_count(self):
+        """Get the number of live explosion particles"""
+        return int(np.count_nonzero(self.life > 0))
+        
+    def get_sprite(self, color, size, bucket):
+        """Get the pre-rendered circle for a particle color, size and alpha bucket"""
+        key = (color, size, bucket)
+        sprite = self.sprite_cache.get(key)
+        if sprite is None:
+            alpha = 255 * bucket // PARTICLE_ALPHA_BUCKETS
+            sprite = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, alpha), (size, size), size)
+            self.sprite_cache[key] = sprite
+        return sprite
+        
+    def draw(self, screen, font_size=FONT_SIZE_HUD):
         """Draw all particles"""
-        for particle in self.particles:
-            alpha = int(255 * particle['life'])
-            color = (*particle['color'], alpha)
+        alive = np.flatnonzero(self.life > 0)
+        if len(alive):
+            # Fade with life, quantized to the pre-rendered alpha buckets
+            buckets = np.ceil(self.life[alive] * PARTICLE_ALPHA_BUCKETS).astype(np.int64)
+            np.clip(buckets, 1, PARTICLE_ALPHA_BUCKETS, out=buckets)
+            sizes = self.size[alive]
+            xs = (self.x[alive] - sizes).astype(int).tolist()
+            ys = (self.y[alive] - sizes).astype(int).tolist()
             
-            if particle.get('type') == 'score':
-                # Draw score text
-                if font:
-                    text_surface = font.render(particle['text'], True, particle['color'])
-                    # Apply alpha
-                    text_surface.set_alpha(alpha)
-                    screen.blit(text_surface, (particle['x'], particle['y']))
-                    
-                    # Draw multiplier text if present
-                    if particle['multiplier_text']:
-                        mult_surface = font.render(particle['multiplier_text'], True, (255, 100, 100))
-                        mult_surface.set_alpha(alpha)
-                        screen.blit(mult_surface, (particle['x'] + 40, particle['y'] - 15))
-            else:
-                # Draw explosion particle
-                try:
-                    pygame.draw.circle(screen, particle['color'], 
-                                     (int(particle['x']), int(particle['y'])), 
-                                     particle['size'])
-                except:
-                    pass  # Skip if position is invalid
+            # Look up each distinct (color, size, bucket) once, via a packed integer key
+            colors = self.color[alive]
+            keys = ((colors.astype(np.int64) @ np.array([1 << 24, 1 << 16, 1 << 8])) | sizes) << 8 | buckets
+            _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+            sprites = [self.get_sprite(tuple(color), size, bucket) for color, size, bucket
+                       in zip(colors[first].tolist(), sizes[first].tolist(), buckets[first].tolist())]
+            screen.blits([(sprites[i], position) for i, position in zip(inverse.tolist(), zip(xs, ys))], False)
+            
+        for popup in self.popups:
+            # Quantized like particles, so faded text is shared through the text cache
+            alpha = 255 * max(1, math.ceil(popup['life'] * PARTICLE_ALPHA_BUCKETS)) // PARTICLE_ALPHA_BUCKETS
+            
+            # Draw score text
+            text_surface = text_cache.render(popup['text'], font_size, popup['color'], alpha)
+            screen.blit(text_surface, (popup['x'], popup['y']))
+            
+            # Draw multiplier text if present
+            if popup['multiplier_text']:
+                mult_surface = text_cache.render(popup['multiplier_text'], font_size, (255, 100, 100), alpha)
+                screen.blit(mult_surface, (popup['x'] + 40, popup['y'] - 15))
                     
     def clear(self):
         """Clear all particles"""
-        self.particles.clear()
+        self.life[:] = 0
+        self.popups.clear()
 
 class ScreenShake:
     def __init__(self):
@@ -179,7 +224,6 @@ class ScreenShake:
             self.shake_duration -= delta_time
             
             if self.shake_duration > 0:
-                import random
                 self.shake_x = random.randint(-self.shake_intensity, self.shake_intensity)
                 self.shake_y = random.randint(-self.shake_intensity, self.shake_intensity)
             else:
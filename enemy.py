@@ -1,21 +1,59 @@
 import random
 import math
-import pygame
 from settings import (
     ENEMY_SPAWN_MIN_Y, ENEMY_SPAWN_MAX_Y, ENEMY_MIN_SPACING,
     ENEMY_SHOOT_INTERVAL_MIN, ENEMY_SHOOT_INTERVAL_MAX, SCREEN_HEIGHT
 )
 
+class EngineField:
+    """Enemy attribute stored in its movement group's arrays while attached to an engine"""
+    def __set_name__(self, owner, name):
+        self.name = name
+        
+    def __get__(self, enemy, owner=None):
+        if enemy is None:
+            return self
+        group = enemy.__dict__.get("group")
+        if group is None:
+            return enemy.__dict__[self.name]
+        return float(group.arrays[self.name][enemy.slot])
+        
+    def __set__(self, enemy, value):
+        group = enemy.__dict__.get("group")
+        if group is None:
+            enemy.__dict__[self.name] = value
+        else:
+            group.arrays[self.name][enemy.slot] = value
+
 class Enemy:
-    def __init__(self, base_x, ai_level=0):
+    # Movement state shared with EnemyMovementEngine (see enemy_engine.COMMON_FIELDS)
+    base_x = EngineField()
+    y = EngineField()
+    prev_x = EngineField()
+    prev_y = EngineField()
+    original_base_x = EngineField()
+    current_speed_x = EngineField()
+    current_speed_y = EngineField()
+    player_velocity = EngineField()
+    last_player_x = EngineField()
+    
+    def __init__(self, base_x, ai_level=0, movement_type=None):
+        # Movement group and slot while simulated by an EnemyMovementEngine
+        self.group = None
+        self.slot = None
+        
         self.base_x = base_x
         self.original_base_x = base_x  # Store original for some patterns
         self.y = random.randint(ENEMY_SPAWN_MIN_Y, ENEMY_SPAWN_MAX_Y)
         self.y_change = 0.0
+        
+        # Position at the previous simulation step (for interpolation)
+        self.prev_x = base_x
+        self.prev_y = self.y
         self.visible = True
         
         # Enhanced movement system
-        self.movement_type = self._select_movement_type(ai_level)
+        self.movement_type = movement_type or self._select_movement_type(ai_level)
         self.ai_level = ai_level
         self.accuracy = 0.3 + (ai_level * 0.1)
         self.aggression = random.uniform(0.5, 1.0)
@@ -103,11 +141,25 @@ class Enemy:
             self.coordination_range = 150
             self.swarm_influence = random.uniform(0.3, 0.7)
         
-    def update(self, delta_time, current_time, player_x, bg_speed, other_enemies=None):
-        """Update enemy position and behavior with advanced AI"""
+    def attach(self, group, slot):
+        """Hand movement state over to an engine group (values are copied by the group)"""
+        self.group = group
+        self.slot = slot
+        
+    def detach(self, values):
+        """Take movement state back from an engine group"""
+        self.group = None
+        self.slot = None
+        for name, value in values.items():
+            setattr(self, name, bool(value) if name == "is_diving" else float(value))
+            
+    def update(self, delta_time, current_time, player_x, bg_speed, neighbor_index=None):
+        """Update enemy position and behavior with advanced AI (scalar reference path)"""
         if not self.visible:
             return
             
+        self.prev_x = self.base_x
+        self.prev_y = self.y
         normalized_delta = delta_time / 16.67
         
         # Update player tracking
@@ -119,7 +171,7 @@ class Enemy:
         base_descent = bg_speed * random.uniform(1.1, 1.4)
         
         # Advanced movement based on type
-        self._update_advanced_movement(current_time, player_x, normalized_delta, other_enemies)
+        self._update_advanced_movement(current_time, player_x, normalized_delta, neighbor_index)
         
         # Apply movement
         self.base_x += self.current_speed_x * normalized_delta
@@ -132,7 +184,7 @@ class Enemy:
         if self.y > SCREEN_HEIGHT + 50:
             self.visible = False
             
-    def _update_advanced_movement(self, current_time, player_x, delta_time, other_enemies):
+    def _update_advanced_movement(self, current_time, player_x, delta_time, neighbor_index):
         """Handle advanced movement patterns"""
         current_x = self.get_x_position(current_time)
         distance_to_player = abs(current_x - player_x)
@@ -165,7 +217,7 @@ class Enemy:
             self._move_tactical_positioning(player_x, distance_to_player)
             
         elif self.movement_type == "swarm_coordination":
-            self._move_swarm_coordination(player_x, other_enemies)
+            self._move_swarm_coordination(player_x, neighbor_index)
             
     def _move_basic_wave(self, current_time):
         """Basic sine wave movement"""
@@ -270,15 +322,17 @@ class Enemy:
             self.current_speed_x *= 0.9
         self.current_speed_y = 0
         
-    def _move_swarm_coordination(self, player_x, other_enemies):
+    def _move_swarm_coordination(self, player_x, neighbor_index):
         """Coordinate with other enemies"""
-        if other_enemies:
-            # Calculate average position of nearby enemies
-            nearby_enemies = [e for e in other_enemies if e != self and 
-                            abs(e.base_x - self.base_x) < self.coordination_range]
+        if neighbor_index:
+            # Nearby enemies from the frame's sorted-by-x index, excluding itself
+            # (always within range of its own position)
+            nearby_count, nearby_sum = neighbor_index.count_and_sum(self.base_x, self.coordination_range)
+            nearby_count -= 1
+            nearby_sum -= self.base_x
             
-            if nearby_enemies:
-                avg_x = sum(e.base_x for e in nearby_enemies) / len(nearby_enemies)
+            if nearby_count > 0:
+                avg_x = nearby_sum / nearby_count
                 # Move slightly away from swarm center to spread out
                 direction = 1 if self.base_x > avg_x else -1
                 swarm_force = direction * self.swarm_influence
@@ -323,9 +377,9 @@ class Enemy:
                 
         return random.random() < shoot_chance
         
-    def calculate_aim_offset(self, player_x, player_y, bullet_speed):
+    def calculate_aim_offset(self, player_x, player_y, bullet_speed, current_time):
         """Calculate where to aim based on player movement prediction"""
-        enemy_x = self.get_x_position(pygame.time.get_ticks())
+        enemy_x = self.get_x_position(current_time)
         
         # Update player velocity tracking
         player_velocity = player_x - self.last_player_x
@@ -365,6 +419,11 @@ class Enemy:
         """Get enemy position"""
         return self.get_x_position(current_time), self.y
         
+    def get_render_position(self, alpha=1.0):
+        """Get position interpolated between the last two simulation steps"""
+        return (self.prev_x + (self.base_x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+                
     def is_visible(self):
         """Check if enemy is visible"""
         return self.visible
@@ -0,0 +1,271 @@
+import random
+import numpy as np
+from collision import NeighborIndex
+from settings import SCREEN_HEIGHT
+
+# State shared by every movement pattern
+COMMON_FIELDS = [
+    "base_x", "y", "prev_x", "prev_y", "original_base_x",
+    "current_speed_x", "current_speed_y", "player_velocity", "last_player_x"
+]
+
+# Pattern-specific state, mirroring Enemy._init_movement_pattern
+PATTERN_FIELDS = {
+    "basic_wave": ["osc_amplitude", "osc_freq", "osc_offset"],
+    "simple_zigzag": [],
+    "adaptive_wave": ["osc_amplitude", "osc_freq", "osc_offset"],
+    "hunting": ["hunt_aggression", "hunt_distance"],
+    "evasive": ["evasion_speed", "last_evasion", "evasion_cooldown"],
+    "flanking": ["flank_side", "flank_distance", "flank_speed"],
+    "unpredictable": ["chaos_factor", "direction_change_timer", "current_direction"],
+    "aggressive_dive": ["dive_trigger_distance", "dive_speed", "is_diving"],
+    "master_evasion": ["evasion_prediction_time"],
+    "tactical_positioning": ["optimal_distance", "positioning_speed"],
+    "swarm_coordination": ["coordination_range", "swarm_influence"]
+}
+
+def _direction(condition):
+    """Vectorized `1 if condition else -1`"""
+    return np.where(condition, 1.0, -1.0)
+
+class MovementGroup:
+    def __init__(self, movement_type, capacity=16):
+        """Contiguous state arrays for all enemies sharing one movement pattern"""
+        self.movement_type = movement_type
+        self.fields = COMMON_FIELDS + PATTERN_FIELDS[movement_type]
+        self.arrays = {name: np.zeros(capacity) for name in self.fields}
+        self.enemies = []  # Enemy owning each slot
+        self.live = {}  # Views of the occupied part of each array
+        self._refresh_views()
+        
+    def __len__(self):
+        return len(self.enemies)
+        
+    def add(self, enemy):
+        """Copy an enemy's movement state into the next free slot"""
+        slot = len(self.enemies)
+        if slot == len(self.arrays["base_x"]):
+            for name, array in self.arrays.items():
+                self.arrays[name] = np.concatenate((array, np.zeros(len(array))))
+                
+        values = {name: float(getattr(enemy, name)) for name in self.fields}
+        self.enemies.append(enemy)
+        enemy.attach(self, slot)
+        for name, value in values.items():
+            self.arrays[name][slot] = value
+        self._refresh_views()
+        
+    def remove(self, enemy):
+        """Copy an enemy's state back onto it and fill its slot with the last enemy"""
+        slot = enemy.slot
+        values = {name: self.arrays[name][slot] for name in self.fields}
+        enemy.detach(values)
+        
+        last = len(self.enemies) - 1
+        if slot != last:
+            for array in self.arrays.values():
+                array[slot] = array[last]
+            moved = self.enemies[last]
+            self.enemies[slot] = moved
+            moved.slot = slot
+        self.enemies.pop()
+        self._refresh_views()
+        
+    def _refresh_views(self):
+        """Re-slice the live views after the enemy count changed"""
+        n = len(self.enemies)
+        self.live = {name: array[:n] for name, array in self.arrays.items()}
+
+class EnemyMovementEngine:
+    def __init__(self):
+        """Updates enemy movement one vectorized pass per movement pattern"""
+        self.groups = {movement_type: MovementGroup(movement_type) for movement_type in PATTERN_FIELDS}
+        # Seeded from the game's RNG so seeded runs stay reproducible
+        self.rng = np.random.default_rng(random.getrandbits(32))
+        self.neighbor_index = NeighborIndex()  # Start-of-frame x positions for swarm coordination
+        
+    def add(self, enemy):
+        """Start simulating an enemy"""
+        self.groups[enemy.movement_type].add(enemy)
+        
+    def remove(self, enemy):
+        """Stop simulating an enemy"""
+        if enemy.group is not None:
+            enemy.group.remove(enemy)
+            
+    def clear(self):
+        """Remove all enemies"""
+        for group in self.groups.values():
+            for enemy in group.enemies[::-1]:
+                group.remove(enemy)
+                
+    def get_all_x(self):
+        """Get base_x of every simulated enemy"""
+        return np.concatenate([group.live["base_x"] for group in self.groups.values() if len(group)])
+        
+    def update(self, delta_time, current_time, player_x, bg_speed):
+        """Update every enemy; returns the enemies that left the screen"""
+        normalized_delta = delta_time / 16.67
+        
+        # Start-of-frame positions for swarm coordination
+        if len(self.groups["swarm_coordination"]):
+            self.neighbor_index.rebuild(self.get_all_x())
+        
+        off_screen = []
+        for group in self.groups.values():
+            n = len(group)
+            if n == 0:
+                continue
+                
+            base_x = group.live["base_x"]
+            y = group.live["y"]
+            group.live["prev_x"][:] = base_x
+            group.live["prev_y"][:] = y
+            
+            # Update player tracking
+            last_player_x = group.live["last_player_x"]
+            player_velocity = group.live["player_velocity"]
+            player_velocity[:] = (player_x - last_player_x) * 0.7 + player_velocity * 0.3
+            last_player_x[:] = player_x
+            
+            # Base descent speed
+            base_descent = bg_speed * self.rng.uniform(1.1, 1.4, n)
+            
+            # Advanced movement based on type
+            distance_to_player = np.abs(base_x - player_x)
+            move = getattr(self, "_move_" + group.movement_type)
+            move(group, n, current_time, player_x, distance_to_player)
+            
+            # Apply movement
+            base_x += group.live["current_speed_x"] * normalized_delta
+            y += (base_descent + group.live["current_speed_y"]) * normalized_delta
+            
+            # Keep within screen bounds (with some tolerance for advanced maneuvers)
+            np.minimum(np.maximum(base_x, -50, out=base_x), 850, out=base_x)
+            
+            # Collect enemies that went off screen
+            for slot in np.flatnonzero(y > SCREEN_HEIGHT + 50).tolist():
+                off_screen.append(group.enemies[slot])
+                
+        for enemy in off_screen:
+            enemy.visible = False
+        return off_screen
+        
+    def _move_basic_wave(self, group, n, current_time, player_x, distance_to_player):
+        """Basic sine wave movement"""
+        offset = group.live["osc_amplitude"] * np.sin(group.live["osc_freq"] * current_time + group.live["osc_offset"])
+        group.live["current_speed_x"][:] = (group.live["original_base_x"] + offset - group.live["base_x"]) * 0.1
+        group.live["current_speed_y"][:] = 0
+        
+    def _move_simple_zigzag(self, group, n, current_time, player_x, distance_to_player):
+        """No lateral pattern; keeps its current speed"""
+        
+    def _move_adaptive_wave(self, group, n, current_time, player_x, distance_to_player):
+        """Adaptive wave that changes amplitude based on player distance"""
+        dynamic_amplitude = group.live["osc_amplitude"] * (1 + (300 - distance_to_player) / 300)
+        offset = dynamic_amplitude * np.sin(group.live["osc_freq"] * current_time + group.live["osc_offset"])
+        group.live["current_speed_x"][:] = (group.live["original_base_x"] + offset - group.live["base_x"]) * 0.15
+        group.live["current_speed_y"][:] = 0
+        
+    def _move_hunting(self, group, n, current_time, player_x, distance_to_player):
+        """Actively hunt the player"""
+        speed_x = group.live["current_speed_x"]
+        chase = _direction(player_x > group.live["base_x"]) * group.live["hunt_aggression"] * 2.0
+        speed_x[:] = np.where(distance_to_player > group.live["hunt_distance"], chase, speed_x * 0.8)
+        group.live["current_speed_y"][:] = 0
+        
+    def _move_evasive(self, group, n, current_time, player_x, distance_to_player):
+        """Evasive movement that tries to avoid being directly above player"""
+        base_x = group.live["base_x"]
+        speed_x = group.live["current_speed_x"]
+        last_evasion = group.live["last_evasion"]
+        evasion_cooldown = group.live["evasion_cooldown"]
+        
+        ready = current_time - last_evasion > evasion_cooldown
+        evade = ready & (np.abs(base_x - player_x) < 80)
+        settle = ready & ~evade
+        
+        speed_x[evade] = _direction(base_x[evade] > player_x) * group.live["evasion_speed"][evade]
+        last_evasion[evade] = current_time
+        evasion_cooldown[evade] = self.rng.integers(1000, 2001, np.count_nonzero(evade))
+        speed_x[settle] *= 0.9
+        group.live["current_speed_y"][:] = 0
+        
+    def _move_flanking(self, group, n, current_time, player_x, distance_to_player):
+        """Flanking movement - try to attack from the side"""
+        base_x = group.live["base_x"]
+        speed_x = group.live["current_speed_x"]
+        target_x = player_x + group.live["flank_side"] * group.live["flank_distance"]
+        
+        approach = _direction(target_x > base_x) * group.live["flank_speed"]
+        speed_x[:] = np.where(np.abs(base_x - target_x) > 20, approach, speed_x * 0.7)
+        group.live["current_speed_y"][:] = 0
+        
+    def _move_unpredictable(self, group, n, current_time, player_x, distance_to_player):
+        """Chaotic, unpredictable movement"""
+        chaos_factor = group.live["chaos_factor"]
+        timer = group.live["direction_change_timer"]
+        direction = group.live["current_direction"]
+        
+        change = current_time - timer > self.rng.integers(500, 1501, n)
+        direction[change] = self.rng.uniform(-1, 1, np.count_nonzero(change)) * chaos_factor[change]
+        timer[change] = current_time
+        
+        # Add some noise
+        noise = self.rng.uniform(-0.5, 0.5, n) * chaos_factor
+        group.live["current_speed_x"][:] = (direction + noise) * 2.0
+        group.live["current_speed_y"][:] = self.rng.uniform(-0.5, 0.5, n)
+        
+    def _move_aggressive_dive(self, group, n, current_time, player_x, distance_to_player):
+        """Aggressive dive towards player when close"""
+        is_diving = group.live["is_diving"]
+        dive_speed = group.live["dive_speed"]
+        speed_x = group.live["current_speed_x"]
+        
+        is_diving[distance_to_player < group.live["dive_trigger_distance"]] = 1.0
+        diving = is_diving > 0
+        
+        speed_x[:] = np.where(diving, _direction(player_x > group.live["base_x"]) * dive_speed, speed_x * 0.95)
+        group.live["current_speed_y"][:] = np.where(diving, dive_speed * 0.5, 0.0)
+        
+    def _move_master_evasion(self, group, n, current_time, player_x, distance_to_player):
+        """Master-level evasion with prediction"""
+        base_x = group.live["base_x"]
+        speed_x = group.live["current_speed_x"]
+        predicted_player_x = player_x + group.live["player_velocity"] * group.live["evasion_prediction_time"]
+        
+        evade = _direction(base_x > predicted_player_x) * 3.0
+        speed_x[:] = np.where(np.abs(base_x - predicted_player_x) < 100, evade, speed_x * 0.85)
+        group.live["current_speed_y"][:] = 0
+        
+    def _move_tactical_positioning(self, group, n, current_time, player_x, distance_to_player):
+        """Maintain optimal distance for shooting"""
+        base_x = group.live["base_x"]
+        speed_x = group.live["current_speed_x"]
+        optimal_distance = group.live["optimal_distance"]
+        positioning_speed = group.live["positioning_speed"]
+        
+        move_away = _direction(base_x > player_x) * positioning_speed
+        move_closer = _direction(player_x > base_x) * positioning_speed
+        speed_x[:] = np.where(distance_to_player < optimal_distance - 30, move_away,
+                              np.where(distance_to_player > optimal_distance + 30, move_closer, speed_x * 0.9))
+        group.live["current_speed_y"][:] = 0
+        
+    def _move_swarm_coordination(self, group, n, current_time, player_x, distance_to_player):
+        """Coordinate with other enemies"""
+        base_x = group.live["base_x"]
+        swarm_influence = group.live["swarm_influence"]
+        
+        # Nearby enemies via binary-search windows, excluding itself (always within range of its own position)
+        nearby_count, nearby_sum = self.neighbor_index.count_and_sum(base_x, group.live["coordination_range"])
+        nearby_count = nearby_count - 1
+        nearby_sum = nearby_sum - base_x
+        avg_x = nearby_sum / np.maximum(nearby_count, 1)
+        
+        # Move slightly away from swarm center to spread out, and towards the player
+        swarm_force = _direction(base_x > avg_x) * swarm_influence
+        player_force = _direction(player_x > base_x) * (1 - swarm_influence)
+        
+        group.live["current_speed_x"][:] = np.where(nearby_count > 0, (swarm_force + player_force) * 1.5,
+                                                    _direction(player_x > base_x) * 1.0)
+        group.live["current_speed_y"][:] = 0
\ No newline at end of file
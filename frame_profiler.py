@@ -0,0 +1,97 @@
+import time
+import numpy as np
+import pygame
+from text_cache import text_cache
+from settings import PROFILER_HISTORY, PROFILER_REFRESH_FRAMES, FONT_SIZE_PROFILER, COLOR_WHITE, COLOR_YELLOW, COLOR_GRAY
+
+class FrameProfiler:
+    def __init__(self, history=PROFILER_HISTORY):
+        """
+        Rolling per-phase timings of the game loop, plus per-frame counters
+        Each phase keeps its last `history` durations (ms) in a ring buffer
+        """
+        self.history = history
+        self.samples = {}  # phase -> ring buffer of durations, in first-recorded order
+        self.writes = {}  # phase -> samples written so far
+        self.counters = {}  # counter name -> value for the last frame
+        self.active = False  # Overlay visible
+        
+        # Overlay rows are refreshed every few frames, not per frame
+        self.rows = []
+        self.frames_until_refresh = 0
+        self.panel = None
+        
+    def toggle(self):
+        """Show or hide the overlay"""
+        self.active = not self.active
+        self.frames_until_refresh = 0
+        
+    def record(self, phase, start):
+        """Store the time since start (a perf_counter value) for a phase; returns the current perf_counter"""
+        now = time.perf_counter()
+        buffer = self.samples.get(phase)
+        if buffer is None:
+            buffer = self.samples[phase] = np.zeros(self.history)
+            self.writes[phase] = 0
+        buffer[self.writes[phase] % self.history] = (now - start) * 1000
+        self.writes[phase] += 1
+        return now
+        
+    def set_counter(self, name, value):
+        """Set a per-frame counter"""
+        self.counters[name] = value
+        
+    def get_stats(self):
+        """Get p50/p95/max (ms) and the sample count for every phase"""
+        stats = {}
+        for phase, buffer in self.samples.items():
+            values = buffer[:min(self.writes[phase], self.history)]
+            p50, p95 = np.percentile(values, (50, 95))
+            stats[phase] = {"p50": float(p50), "p95": float(p95), "max": float(values.max()), "samples": len(values)}
+        return stats
+        
+    def clear(self):
+        """Drop all samples and counters"""
+        self.samples.clear()
+        self.writes.clear()
+        self.counters.clear()
+        self.rows = []
+        
+    def draw(self, screen, x=440, y=150):
+        """Draw the timing table and counters"""
+        if not self.active:
+            return
+            
+        self.frames_until_refresh -= 1
+        if self.frames_until_refresh <= 0:
+            self._refresh_rows()
+            self.frames_until_refresh = PROFILER_REFRESH_FRAMES
+            
+        # Semi-transparent background, reallocated only when the row count changes
+        line_height = FONT_SIZE_PROFILER - 4
+        height = len(self.rows) * line_height + 10
+        if self.panel is None or self.panel.get_height() != height:
+            self.panel = pygame.Surface((350, height))
+            self.panel.set_alpha(180)
+            self.panel.fill((0, 0, 0))
+        screen.blit(self.panel, (x, y))
+        
+        # Columns: label, then right-aligned values
+        columns = (x + 190, x + 240, x + 290, x + 340)
+        blits = []
+        for row, (cells, color) in enumerate(self.rows):
+            row_y = y + 5 + row * line_height
+            blits.append((text_cache.render(cells[0], FONT_SIZE_PROFILER, color), (x + 5, row_y)))
+            for cell, right in zip(cells[1:], columns):
+                text = text_cache.render(cell, FONT_SIZE_PROFILER, color)
+                blits.append((text, (right - text.get_width(), row_y)))
+        screen.blits(blits, doreturn=False)
+        
+    def _refresh_rows(self):
+        """Format the current stats as overlay rows of (cells, color)"""
+        rows = [(("PROFILER (ms)", "p50", "p95", "max"), COLOR_YELLOW)]
+        for phase, stats in self.get_stats().items():
+            rows.append(((phase, f"{stats['p50']:.2f}", f"{stats['p95']:.2f}", f"{stats['max']:.2f}"), COLOR_WHITE))
+        for name, value in self.counters.items():
+            rows.append(((name, str(value)), COLOR_GRAY))
+        self.rows = rows
\ No newline at end of file
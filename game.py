@@ -1,6 +1,10 @@
+import os
+import time
 import pygame
 import math
+import numpy as np
 from game_states import GameState
+from game_clock import SimulatedClock
 from assets import Assets
 from player import Player
 from bullet import BulletManager
@@ -9,30 +13,57 @@ from hud import HUD
 from wave_system import WaveManager
 from combo_system import ComboSystem, ParticleSystem, ScreenShake
 from menu_system import RetroMenu, HighScoreManager
-from powerup_system import PowerUpManager, PowerUpType
+from powerup_system import PowerUp, PowerUpManager, PowerUpType
 from powerup_test_mode import PowerUpTestMode, PowerUpInfoDisplay
+from text_cache import fonts, text_cache
+from frame_profiler import FrameProfiler
 from collision import (
-    check_bullet_enemy_collision, check_bullet_player_collision,
-    check_enemy_player_collision, check_enemy_enemy_collision, check_dodge_bonus
+    SpatialHash, check_bullet_enemy_collision, check_bullet_player_collision,
+    check_enemy_player_collision, check_dodge_bonus, find_bullet_enemy_hits,
+    find_bullets_near_point, find_enemy_enemy_pairs, collision_counters
 )
 from settings import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, STARTING_LIVES,
-    BG_SPEED_INITIAL, BG_SPEED_MAX, BG_SPEED_INCREASE_RATE,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, IDLE_FPS, SIMULATION_HZ, MAX_FRAME_TIME,
+    STARTING_LIVES, BG_SPEED_INITIAL, BG_SPEED_MAX, BG_SPEED_INCREASE_RATE,
     SCORE_ENEMY_KILL, SCORE_PERFECT_SHOT, SCORE_CHAIN_KILL, SCORE_DODGE_BONUS,
-    PERFECT_SHOT_THRESHOLD
+    PERFECT_SHOT_THRESHOLD, COLLISION_THRESHOLD_BULLET, COLLISION_THRESHOLD_SHIP,
+    DODGE_DISTANCE_MAX, COLLISION_BACKEND, COLOR_BLACK
 )
 
+# States with a static screen, drawn once and ticked at IDLE_FPS
+IDLE_STATES = (GameState.PAUSED, GameState.GAME_OVER)
+
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False):
+        # Headless mode runs the simulation without a window or frame throttling
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            
         pygame.init()
         
-        # Screen setup
+        # Fonts and text cached by an earlier pygame session are no longer valid
+        fonts.clear()
+        text_cache.clear()
+        
+        # Screen setup (dummy display surface when headless)
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Space Invaders")
         
+        # Off-screen world layer: everything that shakes is drawn here, then blitted at the shake offset
+        self.world = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        
+        self.frozen_state = None  # Idle state whose frame is still on the display
+        
         # Clock for frame rate control
         self.clock = pygame.time.Clock()
         
+        # Game clock advanced by fixed simulation steps, decoupled from the render rate
+        self.game_clock = SimulatedClock()
+        self.sim_step = 1000 / SIMULATION_HZ
+        self.accumulator = 0
+        
         # Load assets
         self.assets = Assets()
         self.assets.load_all()
@@ -48,25 +79,31 @@ class Game:
         self.hud = HUD(self.assets)
         
         # New gameplay systems
+        self.on_wave_start = None  # Called with the wave number whenever a wave starts (e.g. memory diagnostics)
         self.wave_manager = WaveManager()
         self.combo_system = ComboSystem()
         self.particle_system = ParticleSystem()
         self.screen_shake = ScreenShake()
         
         # Menu and high score systems
-        self.high_score_manager = HighScoreManager()
+        # Headless runs must not overwrite the player's saved high score
+        self.high_score_manager = HighScoreManager(None if headless else "high_score.json")
         self.menu = RetroMenu(self.assets, self.high_score_manager)
         
         # Power-up system
         self.powerup_manager = PowerUpManager()
         
         # Test mode
-        self.test_mode = PowerUpTestMode(self.powerup_manager, self.assets)
+        self.test_mode = PowerUpTestMode(self.powerup_manager, self.assets, self.game_clock)
         self.info_display = PowerUpInfoDisplay(self.assets)
         
+        # Frame profiler (F3 toggles its overlay)
+        self.profiler = FrameProfiler()
+        self.surfaces_allocated = 0  # Total cached surfaces created, for the per-frame counter
+        
         # Background
-        self.bg_y = 0
-        self.bg_y2 = -SCREEN_HEIGHT
+        self.bg_scroll = 0  # Offset (0 to SCREEN_HEIGHT) of the background strip
+        self.prev_bg_scroll = self.bg_scroll
         self.bg_speed = BG_SPEED_INITIAL
         
         # Game variables
@@ -82,23 +119,27 @@ class Game:
         # Dodge bonus tracking
         self.dodge_bonuses_given = {}  # Track which bullets have given bonuses
         
+        # Collision broadphase grids
+        self.enemy_hash = SpatialHash()
+        self.collision_backend = COLLISION_BACKEND  # "scalar" or "numpy"
+        
     def reset_game(self):
         """Reset game to initial state"""
         self.player.reset()
         self.bullet_manager.clear_all()
         self.enemy_spawner.clear_all()
         
-        self.bg_y = 0
-        self.bg_y2 = -SCREEN_HEIGHT
+        self.bg_scroll = 0  # Offset (0 to SCREEN_HEIGHT) of the background strip
+        self.prev_bg_scroll = self.bg_scroll
         self.bg_speed = BG_SPEED_INITIAL
         
         self.lives = STARTING_LIVES
         self.score = 0
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.game_clock.get_time()
         self.dodge_bonuses_given.clear()
         
         # Reset new systems
-        self.wave_manager = WaveManager()
+        self.wave_manager = WaveManager(self.on_wave_start)
         self.combo_system = ComboSystem()
         self.particle_system.clear()
         self.screen_shake = ScreenShake()
@@ -112,6 +153,10 @@ class Game:
             if event.type == pygame.QUIT:
                 return False
                 
+            # Input (e.g. test mode keys) or an exposed window can change a frozen frame
+            if event.type in (pygame.KEYDOWN, pygame.VIDEOEXPOSE):
+                self.frozen_state = None
+                
             # Handle menu events
             if self.state == GameState.MENU:
                 menu_action = self.menu.handle_input(event)
@@ -124,6 +169,8 @@ class Game:
                 # Test mode input (works in any state)
                 if event.key == pygame.K_t:
                     self.test_mode.toggle()
+                elif event.key == pygame.K_F3:
+                    self.profiler.toggle()
                 elif self.test_mode.handle_input(event):
                     pass  # Test mode handled the input
                     
@@ -153,16 +200,17 @@ class Game:
         
     def update_background(self, delta_time):
         """Update scrolling background"""
+        self.prev_bg_scroll = self.bg_scroll
+        
         # Normalize delta_time to 60 FPS (delta_time is in milliseconds)
         normalized_delta = delta_time / 16.67  # 16.67ms = 1/60th second
-        self.bg_y += self.bg_speed * normalized_delta
-        self.bg_y2 += self.bg_speed * normalized_delta
+        self.bg_scroll = (self.bg_scroll + self.bg_speed * normalized_delta) % SCREEN_HEIGHT
+        
+    def _interpolate_bg(self, alpha):
+        """Interpolate the background scroll offset, continuing across a wrap"""
+        distance = (self.bg_scroll - self.prev_bg_scroll) % SCREEN_HEIGHT
+        return (self.prev_bg_scroll + distance * alpha) % SCREEN_HEIGHT
         
-        if self.bg_y >= SCREEN_HEIGHT:
-            self.bg_y = -SCREEN_HEIGHT
-        if self.bg_y2 >= SCREEN_HEIGHT:
-            self.bg_y2 = -SCREEN_HEIGHT
-            
     def handle_wave_spawning(self, current_time):
         """Handle wave-based enemy spawning"""
         # Ensure we have at least one enemy (fallback for test mode issues)
@@ -190,7 +238,7 @@ class Game:
         
     def try_shoot(self):
         """Try to shoot with cooldown and power-up effects"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.game_clock.get_time()
         
         # Determine cooldown based on rapid fire power-up
         cooldown = self.rapid_fire_cooldown if self.powerup_manager.is_active(PowerUpType.RAPID_FIRE) else self.normal_shot_cooldown
@@ -210,72 +258,100 @@ class Game:
                 
             self.last_shot_time = current_time
             
-    def handle_powerup_collection(self):
+    def handle_powerup_collection(self, current_time):
         """Handle power-up collection by player"""
         player_x, player_y = self.player.get_position()
-        collected = self.powerup_manager.check_collection(player_x, player_y)
+        collected = self.powerup_manager.check_collection(player_x, player_y, current_time)
         
         for powerup_type in collected:
             if powerup_type == PowerUpType.SCREEN_CLEAR:
                 # Clear all enemies and give points
                 enemies = self.enemy_spawner.get_enemies()
                 for enemy in enemies[:]:
-                    enemy_x, enemy_y = enemy.get_position(pygame.time.get_ticks())
+                    enemy_x, enemy_y = enemy.get_position(current_time)
                     self.particle_system.add_explosion(enemy_x, enemy_y, (255, 150, 0), 15)
                     self.score += 50  # Bonus points per cleared enemy
                     self.enemy_spawner.remove_enemy(enemy)
                 self.screen_shake.add_shake(800, 8)
                 
-    def update_difficulty(self):
+    def update_difficulty(self, current_time):
         """Update game difficulty based on time elapsed"""
-        time_elapsed = pygame.time.get_ticks() - self.start_time
+        time_elapsed = current_time - self.start_time
         self.bg_speed = min(BG_SPEED_MAX, BG_SPEED_INITIAL + (time_elapsed / BG_SPEED_INCREASE_RATE))
         
+    def find_player_bullet_hits(self, player_bullets, enemies, enemy_positions, current_time):
+        """Get (bullet, enemy) hit pairs in bullet order; each enemy is hit at most once"""
+        if self.collision_backend == "numpy":
+            hits = find_bullet_enemy_hits(player_bullets.positions(), np.array(enemy_positions, dtype=float).reshape(-1, 2))
+            return [(player_bullets[b], enemies[e]) for b, e in hits]
+            
+        hits = []
+        for player_bullet in player_bullets:
+            bullet_x, bullet_y = player_bullet.get_position()
+            for enemy in self.enemy_hash.query(bullet_x, bullet_y, COLLISION_THRESHOLD_BULLET):
+                if check_bullet_enemy_collision(player_bullet, enemy, current_time):
+                    self.enemy_hash.remove(enemy)
+                    hits.append((player_bullet, enemy))
+                    break
+        return hits
+        
+    def find_bullets_near_player(self, enemy_bullets):
+        """Get enemy bullets within dodge range of the player, in list order"""
+        # Both backends filter the pool's position arrays; hashing every bullet each tick
+        # allocated a tuple and a bucket entry per bullet, and the churn caused gc pauses
+        player_x, player_y = self.player.get_position()
+        near = find_bullets_near_point(enemy_bullets.positions(), player_x, player_y, DODGE_DISTANCE_MAX)
+        return [enemy_bullets[i] for i in near.tolist()]
+        
     def handle_collisions(self, current_time, delta_time):
         """Handle all collision detection and responses"""
         enemies = self.enemy_spawner.get_enemies()
         enemy_bullets = self.bullet_manager.get_enemy_bullets()
         
+        # Broadphase: bucket enemies once per frame
+        enemy_positions = [enemy.get_position(current_time) for enemy in enemies]
+        self.enemy_hash.rebuild(enemies, enemy_positions)
+        
         # Player bullets vs enemies
         player_bullets = self.bullet_manager.get_player_bullets()
-        for player_bullet in player_bullets:
-            for enemy in enemies[:]:
-                if check_bullet_enemy_collision(player_bullet, enemy, current_time):
-                    player_bullet.deactivate()
-                    
-                    # Calculate base score
-                    enemy_x, enemy_y = enemy.get_position(current_time)
-                    base_score = SCORE_PERFECT_SHOT if enemy_y < PERFECT_SHOT_THRESHOLD else SCORE_ENEMY_KILL
-                    
-                    # Add to combo system
-                    self.combo_system.add_kill(current_time)
-                    
-                    # Apply combo multiplier
-                    final_score = self.combo_system.apply_multiplier(base_score)
-                    
-                    # Apply score multiplier power-up
-                    if self.powerup_manager.is_active(PowerUpType.SCORE_MULTIPLIER):
-                        final_score *= 2
-                        
-                    self.score += final_score
-                    
-                    # Visual effects
-                    self.particle_system.add_explosion(enemy_x, enemy_y)
-                    self.particle_system.add_score_popup(enemy_x, enemy_y, final_score, self.combo_system.get_score_multiplier())
-                    self.screen_shake.add_shake(200, 3)
-                    
-                    # Try to spawn power-up
-                    self.powerup_manager.try_spawn_powerup(enemy_x, enemy_y)
-                    
-                    # Notify wave manager
-                    self.wave_manager.enemy_killed()
-                    
-                    # Remove enemy (wave system handles respawning)
-                    self.enemy_spawner.remove_enemy(enemy)
-                    break
-                    
-        # Enemy bullets vs player
-        for bullet in enemy_bullets[:]:
+        hits = self.find_player_bullet_hits(player_bullets, enemies, enemy_positions, current_time)
+        for player_bullet, enemy in hits:
+            player_bullet.deactivate()
+            
+            # Calculate base score
+            enemy_x, enemy_y = enemy.get_position(current_time)
+            base_score = SCORE_PERFECT_SHOT if enemy_y < PERFECT_SHOT_THRESHOLD else SCORE_ENEMY_KILL
+            
+            # Add to combo system
+            self.combo_system.add_kill(current_time)
+            
+            # Apply combo multiplier
+            final_score = self.combo_system.apply_multiplier(base_score)
+            
+            # Apply score multiplier power-up
+            if self.powerup_manager.is_active(PowerUpType.SCORE_MULTIPLIER):
+                final_score *= 2
+                
+            self.score += final_score
+            
+            # Visual effects
+            self.particle_system.add_explosion(enemy_x, enemy_y)
+            self.particle_system.add_score_popup(enemy_x, enemy_y, final_score, self.combo_system.get_score_multiplier())
+            self.screen_shake.add_shake(200, 3)
+            
+            # Try to spawn power-up
+            self.powerup_manager.try_spawn_powerup(enemy_x, enemy_y, current_time)
+            
+            # Notify wave manager
+            self.wave_manager.enemy_killed()
+            
+            # Remove enemy (wave system handles respawning)
+            self.enemy_hash.remove(enemy)
+            self.enemy_spawner.remove_enemy(enemy)
+            
+        # Enemy bullets vs player (only bullets within dodge range can hit or earn a bonus)
+        near_bullets = self.find_bullets_near_player(enemy_bullets)
+        for bullet in near_bullets:
             if check_bullet_player_collision(bullet, self.player):
                 bullet.deactivate()
                 
@@ -314,8 +390,15 @@ class Game:
                     if bullet_id in self.dodge_bonuses_given:
                         del self.dodge_bonuses_given[bullet_id]
                         
+        # Bullets outside the query range (or gone) have moved away, so reset them too
+        near_ids = {id(bullet) for bullet in near_bullets}
+        for bullet_id in list(self.dodge_bonuses_given):
+            if bullet_id not in near_ids:
+                del self.dodge_bonuses_given[bullet_id]
+                
         # Player vs enemies
-        for enemy in enemies[:]:
+        player_x, player_y = self.player.get_position()
+        for enemy in self.enemy_hash.query(player_x, player_y, COLLISION_THRESHOLD_SHIP):
             if check_enemy_player_collision(enemy, self.player, current_time):
                 if not self.test_mode.active:
                     self.lives -= 1
@@ -327,37 +410,41 @@ class Game:
                                                      self.player.get_position()[1], (255, 0, 0), 8)
                     
                 ai_level = min(5, self.score // 500)
+                self.enemy_hash.remove(enemy)
                 self.enemy_spawner.remove_enemy(enemy)
                 self.enemy_spawner.spawn_enemy(ai_level)
                 break
                 
-        # Enemy vs enemy collisions
-        for i, enemy1 in enumerate(enemies):
-            for j, enemy2 in enumerate(enemies[i+1:], i+1):
-                if check_enemy_enemy_collision(enemy1, enemy2, current_time):
-                    # Chain kill bonus with combo multiplier
-                    self.combo_system.add_kill(current_time)
-                    final_score = self.combo_system.apply_multiplier(SCORE_CHAIN_KILL)
-                    self.score += final_score
-                    
-                    # Visual effects for both enemies
-                    enemy1_x, enemy1_y = enemy1.get_position(current_time)
-                    enemy2_x, enemy2_y = enemy2.get_position(current_time)
-                    
-                    self.particle_system.add_explosion(enemy1_x, enemy1_y, (255, 100, 100), 12)
-                    self.particle_system.add_explosion(enemy2_x, enemy2_y, (255, 100, 100), 12)
-                    self.particle_system.add_score_popup((enemy1_x + enemy2_x) // 2, (enemy1_y + enemy2_y) // 2, 
-                                                       final_score, self.combo_system.get_score_multiplier())
-                    self.screen_shake.add_shake(400, 5)
-                    
-                    # Notify wave manager (2 kills)
-                    self.wave_manager.enemy_killed()
-                    self.wave_manager.enemy_killed()
-                    
-                    # Remove enemies
-                    self.enemy_spawner.remove_enemy(enemy1)
-                    self.enemy_spawner.remove_enemy(enemy2)
-                    break
+        # Enemy vs enemy collisions: every colliding pair this frame, each enemy dying once
+        for i, j in find_enemy_enemy_pairs(enemy_positions):
+            enemy1, enemy2 = enemies[i], enemies[j]
+            if not (self.enemy_hash.contains(enemy1) and self.enemy_hash.contains(enemy2)):
+                continue  # Already destroyed this frame
+                
+            # Chain kill bonus with combo multiplier
+            self.combo_system.add_kill(current_time)
+            final_score = self.combo_system.apply_multiplier(SCORE_CHAIN_KILL)
+            self.score += final_score
+            
+            # Visual effects for both enemies
+            enemy1_x, enemy1_y = enemy_positions[i]
+            enemy2_x, enemy2_y = enemy_positions[j]
+            
+            self.particle_system.add_explosion(enemy1_x, enemy1_y, (255, 100, 100), 12)
+            self.particle_system.add_explosion(enemy2_x, enemy2_y, (255, 100, 100), 12)
+            self.particle_system.add_score_popup((enemy1_x + enemy2_x) // 2, (enemy1_y + enemy2_y) // 2, 
+                                               final_score, self.combo_system.get_score_multiplier())
+            self.screen_shake.add_shake(400, 5)
+            
+            # Notify wave manager (2 kills)
+            self.wave_manager.enemy_killed()
+            self.wave_manager.enemy_killed()
+            
+            # Remove enemies
+            self.enemy_hash.remove(enemy1)
+            self.enemy_hash.remove(enemy2)
+            self.enemy_spawner.remove_enemy(enemy1)
+            self.enemy_spawner.remove_enemy(enemy2)
                     
     def handle_enemy_shooting(self, current_time, delta_time):
         """Handle enhanced enemy shooting logic"""
@@ -370,22 +457,23 @@ class Game:
                 bullet_speed = self.bg_speed * 1.75
                 
                 # Calculate smart aim offset
-                aim_offset = enemy.calculate_aim_offset(player_x, player_y, bullet_speed)
+                aim_offset = enemy.calculate_aim_offset(player_x, player_y, bullet_speed, current_time)
                 
                 # Fire bullet with aim offset
                 self.bullet_manager.fire_enemy_bullet(enemy_x + aim_offset, enemy_y, bullet_speed)
                 enemy.shoot(current_time)
                 
-    def update(self, delta_time):
-        """Update game logic"""
+    def update(self, delta_time, keys=None):
+        """Update game logic; keys overrides the keyboard state (e.g. scripted input)"""
         if self.state == GameState.MENU:
             self.menu.update(delta_time)
             return
         elif self.state != GameState.PLAYING:
             return
             
-        current_time = pygame.time.get_ticks()
-        keys = pygame.key.get_pressed()
+        current_time = self.game_clock.get_time()
+        if keys is None:
+            keys = pygame.key.get_pressed()
         
         # Apply bullet time effect to enemies and bullets (not player)
         time_multiplier = self.powerup_manager.get_time_multiplier()
@@ -397,16 +485,22 @@ class Game:
         self.player.update(keys, delta_time, speed_multiplier)  # Player not affected by bullet time
         
         # Bullets and enemies affected by bullet time
+        profiler = self.profiler
+        start = time.perf_counter()
         self.bullet_manager.update(bullet_delta)
+        start = profiler.record("update.bullets", start)
         self.enemy_spawner.update_enemies(enemy_delta, current_time, 
                                         self.player.get_position()[0], self.bg_speed)
+        profiler.record("update.enemies", start)
         
         # Update new systems
         self.wave_manager.update(current_time)
         self.combo_system.update(current_time)
+        start = time.perf_counter()
         self.particle_system.update(delta_time)  # Particles not affected by bullet time
+        profiler.record("update.particles", start)
         self.screen_shake.update(delta_time)  # Screen shake not affected by bullet time
-        self.powerup_manager.update(delta_time, self.bg_speed)
+        self.powerup_manager.update(delta_time, current_time, self.bg_speed)
         
 
         
@@ -415,24 +509,43 @@ class Game:
         
         # Update background and difficulty (affected by bullet time)
         self.update_background(delta_time * time_multiplier)
-        self.update_difficulty()
+        self.update_difficulty(current_time)
         
         # Handle enemy shooting (affected by bullet time)
+        start = time.perf_counter()
         self.handle_enemy_shooting(current_time, enemy_delta)
+        start = profiler.record("update.enemy_shooting", start)
         
         # Handle collisions
         self.handle_collisions(current_time, bullet_delta)
+        profiler.record("update.collisions", start)
         
         # Handle power-up collection
-        self.handle_powerup_collection()
+        self.handle_powerup_collection(current_time)
         
         # Handle continuous shooting for rapid fire (player not affected by bullet time)
         if keys[pygame.K_SPACE]:
             self.try_shoot()
         
-    def draw(self):
-        """Draw everything on screen"""
-        current_time = pygame.time.get_ticks()
+    def draw(self, alpha=1.0):
+        """Draw everything on screen
+        
+        alpha is how far (0-1) the renderer is between the last two simulation steps.
+        """
+        if self.state != GameState.PLAYING:
+            alpha = 1.0  # Simulation is frozen, so draw the latest state
+            
+        # Paused and game-over frames are static: compose them once and leave them on the display
+        if self.state in IDLE_STATES:
+            if self.frozen_state == self.state:
+                return
+            self.frozen_state = self.state
+        else:
+            self.frozen_state = None
+            
+        current_time = self.game_clock.get_time()
+        profiler = self.profiler
+        start = time.perf_counter()
         
         if self.state == GameState.MENU:
             self.menu.draw(self.screen)
@@ -441,43 +554,48 @@ class Game:
             # Apply screen shake offset
             shake_x, shake_y = self.screen_shake.get_offset()
             
-            # Draw background (with shake)
-            self.screen.blit(self.assets.get_background(), (shake_x, self.bg_y + shake_y))
-            self.screen.blit(self.assets.get_background(), (shake_x, self.bg_y2 + shake_y))
-            # Draw game objects (with shake)
-            temp_player_pos = self.player.get_position()
-            self.screen.blit(self.assets.get_player_img(), (temp_player_pos[0] + shake_x, temp_player_pos[1] + shake_y))
+            # Draw the world unshaken: into its layer while shaking, else straight to the screen
+            shaking = shake_x or shake_y
+            world = self.world if shaking else self.screen
             
-            # Draw bullets (with shake applied in bullet manager)
-            self.bullet_manager.draw(self.screen, self.assets)
+            # Draw background (one blit of the double-height strip)
+            bg_scroll = self._interpolate_bg(alpha)
+            world.blit(self.assets.get_background_strip(), (0, bg_scroll - SCREEN_HEIGHT))
             
-            # Draw enemies (with shake)
-            for enemy in self.enemy_spawner.get_enemies():
-                if enemy.is_visible():
-                    enemy_x, enemy_y = enemy.get_position(current_time)
-                    self.screen.blit(self.assets.get_enemy_img(), (enemy_x + shake_x, enemy_y + shake_y))
-                    
-            # Draw particles (no shake - they have their own movement)
-            self.particle_system.draw(self.screen, self.assets.font_hud)
+            # Draw game objects, all sprites come from the atlas surface
+            atlas = self.assets.get_atlas()
+            world.blit(atlas.surface, self.player.get_render_position(alpha), atlas.get_rect("player"))
             
-            # Draw HUD (no shake - UI should be stable)
-            self.hud.draw_score(self.screen, self.score)
-            self.hud.draw_lives(self.screen, self.lives)
+            # Draw bullets
+            self.bullet_manager.draw(world, self.assets, alpha)
             
-            # Draw wave info
-            wave_info = self.wave_manager.get_wave_info()
-            self.hud.draw_wave_info(self.screen, wave_info)
+            # Draw enemies in one blits batch
+            enemy_area = atlas.get_rect("enemy")
+            world.blits([(atlas.surface, enemy.get_render_position(alpha), enemy_area)
+                         for enemy in self.enemy_spawner.get_enemies()], False)
+                    
+            # Draw power-ups
+            self.powerup_manager.draw(world, current_time, alpha, atlas)
             
-            # Draw combo info
-            combo_info = self.combo_system.get_combo_info()
-            self.hud.draw_combo_info(self.screen, combo_info)
+            # Shake the whole world in one blit, clearing the edges it uncovers
+            if shaking:
+                self.screen.fill(COLOR_BLACK)
+                self.screen.blit(world, (shake_x, shake_y))
+            start = profiler.record("draw.world", start)
+                
+            # Draw particles (no shake - they have their own movement)
+            self.particle_system.draw(self.screen)
+            start = profiler.record("draw.particles", start)
             
-            # Draw power-ups
-            self.powerup_manager.draw(self.screen)
+            # Draw wave complete overlay
+            wave_info = self.wave_manager.get_wave_info()
+            self.hud.draw_wave_transition(self.screen, wave_info)
             
-            # Draw active power-up indicators
-            active_powerups = self.powerup_manager.get_active_powerups()
-            self.hud.draw_active_powerups(self.screen, active_powerups)
+            # Draw HUD (no shake - UI should be stable) from its retained layer
+            combo_info = self.combo_system.get_combo_info(current_time)
+            active_powerups = self.powerup_manager.get_active_powerups(current_time)
+            self.hud.draw(self.screen, self.score, self.lives, wave_info, combo_info, active_powerups)
+            start = profiler.record("draw.hud", start)
             
             # Draw test mode UI and info
             if self.test_mode.active:
@@ -487,15 +605,45 @@ class Game:
             self.test_mode.draw_ui(self.screen)
             self.test_mode.draw_help_hint(self.screen)
             
-            # Draw pause overlay if paused
+            # Draw pause overlay if paused (drawn once, then the frame stays frozen)
             if self.state == GameState.PAUSED:
                 self.hud.draw_paused(self.screen)
-                
+            profiler.record("draw.ui", start)
+            
+            # Draw the profiler overlay on top of everything
+            self._update_profiler_counters()
+            profiler.draw(self.screen)
+            
         elif self.state == GameState.GAME_OVER:
             is_new_high_score = getattr(self, 'is_new_high_score', False)
             self.hud.draw_game_over(self.screen, self.score, is_new_high_score)
             
+        self.present()
+        
+    def present(self):
+        """Push the frame to the display"""
+        start = time.perf_counter()
         pygame.display.update()
+        self.profiler.record("display.update", start)
+        
+    def _update_profiler_counters(self):
+        """Set the per-frame counters shown by the profiler overlay"""
+        profiler = self.profiler
+        
+        # Narrowphase tests since the last frame (all simulation steps in between)
+        profiler.set_counter("collision pair tests", collision_counters["pair_tests"])
+        collision_counters["pair_tests"] = 0
+        
+        profiler.set_counter("enemies", len(self.enemy_spawner.get_enemies()))
+        profiler.set_counter("player bullets", self.bullet_manager.player_bullets.active_count)
+        profiler.set_counter("enemy bullets", self.bullet_manager.enemy_bullets.active_count)
+        profiler.set_counter("particles", self.particle_system.get_count())
+        profiler.set_counter("power-ups", len(self.powerup_manager.powerups))
+        
+        # Every surface the game creates while running comes from one of these caches
+        allocated = text_cache.misses + len(self.particle_system.sprite_cache) + len(PowerUp.sprite_cache)
+        profiler.set_counter("surfaces allocated", allocated - self.surfaces_allocated)
+        self.surfaces_allocated = allocated
         
     def run(self):
         """Main game loop"""
@@ -503,19 +651,62 @@ class Game:
         running = True
         
         while running:
-            # Calculate delta time for frame-rate independent movement
-            delta_time = self.clock.tick(FPS)
+            # Real time since the last rendered frame, clamped after stalls
+            frame_time = min(self.clock.tick(IDLE_FPS if self.state in IDLE_STATES else FPS), MAX_FRAME_TIME)
+            self.accumulator += frame_time
             
             # Handle events
             running = self.handle_events()
             
-            # Update game
-            self.update(delta_time)
+            # Step the simulation at a fixed rate, independent of the render rate
+            while self.accumulator >= self.sim_step:
+                self.game_clock.tick(self.sim_step)
+                self.update(self.sim_step)
+                self.accumulator -= self.sim_step
+                
+            # Draw everything, interpolated between the last two simulation steps
+            self.draw(self.accumulator / self.sim_step)
             
-            # Draw everything
-            self.draw()
+        pygame.quit()
+        
+    def run_headless(self, ticks, delta_time=1000 / SIMULATION_HZ):
+        """Fast-forward the simulation without drawing or frame throttling.
+        
+        Drives update() with a fixed delta_time (ms) for the given number of ticks,
+        restarting the game whenever it ends, and reports simulated ticks per second.
+        """
+        self.reset_game()
+        games_played = 1
+        
+        start = time.perf_counter()
+        for _ in range(ticks):
+            # Keep the event queue drained so SDL doesn't fill up
+            pygame.event.pump()
+            
+            self.game_clock.tick(delta_time)
+            self.update(delta_time)
             
+            if self.state == GameState.GAME_OVER:
+                self.reset_game()
+                games_played += 1
+        elapsed = time.perf_counter() - start
+        
+        ticks_per_second = ticks / elapsed if elapsed > 0 else float("inf")
+        stats = {
+            "ticks": ticks,
+            "delta_time": delta_time,
+            "simulated_ms": ticks * delta_time,
+            "elapsed_s": elapsed,
+            "ticks_per_second": ticks_per_second,
+            "games_played": games_played,
+            "final_score": self.score,
+            "wave": self.wave_manager.get_wave_info()['number']
+        }
+        print(f"Headless: {ticks} ticks in {elapsed:.2f}s "
+              f"({ticks_per_second:.0f} ticks/s, {stats['simulated_ms'] / 1000:.1f}s simulated)")
+              
         pygame.quit()
+        return stats
 
 if __name__ == "__main__":
     game = Game()
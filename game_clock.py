@@ -0,0 +1,13 @@
+class SimulatedClock:
+    """Virtual game clock that only advances by the simulated frame deltas, passed to every subsystem"""
+    def __init__(self, start_time=0):
+        self.current_time = start_time
+        
+    def tick(self, delta_time=0):
+        """Advance simulated time by delta_time milliseconds"""
+        self.current_time += delta_time
+        return self.current_time
+        
+    def get_time(self):
+        """Get the simulated time (ms) of the current frame"""
+        return self.current_time
\ No newline at end of file
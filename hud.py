@@ -1,68 +1,105 @@
 import pygame
 import math
-from settings import COLOR_YELLOW, COLOR_WHITE, COLOR_RED, COLOR_GRAY, COLOR_BLACK
+from text_cache import text_cache
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_YELLOW, COLOR_WHITE, COLOR_RED, COLOR_GRAY, COLOR_BLACK,
+    FONT_SIZE_HUD, FONT_SIZE_GAME_OVER, FONT_SIZE_SMALL
+)
+
+WAVE_BAR_WIDTH = 100
+COMBO_BAR_WIDTH = 80
 
 class HUD:
     def __init__(self, assets):
         self.assets = assets
         self.combo_pulse_time = 0
         
+        # Retained layer: each widget is re-rendered onto it only when its backing value changes
+        # (widgets never overlap, so clearing one never erases another)
+        self.layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.widget_values = {}  # widget name -> value it was last rendered with
+        self.widget_rects = {}  # widget name -> rects it covers on the layer
+        
+        # Full-screen dimming overlays, allocated once
+        self.pause_overlay = self._make_overlay(128)
+        self.transition_overlay = self._make_overlay(64)  # Lighter than pause overlay
+        
+    @staticmethod
+    def _make_overlay(alpha):
+        """Create a black full-screen surface with surface-wide transparency"""
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        overlay.set_alpha(alpha)
+        overlay.fill(COLOR_BLACK)
+        return overlay
+        
+    def draw(self, screen, score, lives, wave_info, combo_info, active_powerups):
+        """Update changed widgets and blit the HUD layer"""
+        self._update_widget("score", score, self.draw_score, score)
+        self._update_widget("lives", lives, self.draw_lives, lives)
+        
+        in_transition = wave_info['in_transition']
+        wave_value = (wave_info['number'], in_transition,
+                      None if in_transition else wave_info['enemies_left'],
+                      None if in_transition else int(WAVE_BAR_WIDTH * wave_info['progress']))
+        self._update_widget("wave", wave_value, self.draw_wave_info, wave_info)
+        
+        combo_state = self._get_combo_state(combo_info)
+        self._update_widget("combo", combo_state, self.draw_combo_info, combo_state)
+        
+        powerup_value = tuple((powerup_type, int(time_left // 1000)) for powerup_type, time_left in active_powerups)
+        self._update_widget("powerups", powerup_value, self.draw_active_powerups, active_powerups)
+        
+        # One source layer, blitted only where widgets are
+        screen.blits([(self.layer, rect, rect) for rects in self.widget_rects.values() for rect in rects], False)
+        
+    def _update_widget(self, name, value, draw, *args):
+        """Re-render a widget onto the layer if its value changed since it was last drawn"""
+        if name in self.widget_values and self.widget_values[name] == value:
+            return
+            
+        for rect in self.widget_rects.get(name, []):
+            self.layer.fill((0, 0, 0, 0), rect)
+        rects = draw(self.layer, *args)
+        self.widget_rects[name] = [rects] if isinstance(rects, pygame.Rect) else rects
+        self.widget_values[name] = value
+        
     def draw_score(self, screen, score, x=700, y=10):
-        """Draw the score on screen"""
-        text = self.assets.font_hud.render(f"Score: {score}", True, COLOR_YELLOW)
-        screen.blit(text, (x, y))
+        """Draw the score on screen; returns the rect drawn"""
+        text = text_cache.render(f"Score: {score}", FONT_SIZE_HUD, COLOR_YELLOW)
+        return screen.blit(text, (x, y))
         
     def draw_lives(self, screen, lives, x=10, y=10):
-        """Draw the lives on screen"""
-        text = self.assets.font_hud.render(f"Lives: {lives}", True, COLOR_WHITE)
-        screen.blit(text, (x, y))
+        """Draw the lives on screen; returns the rect drawn"""
+        text = text_cache.render(f"Lives: {lives}", FONT_SIZE_HUD, COLOR_WHITE)
+        return screen.blit(text, (x, y))
         
     def draw_paused(self, screen):
         """Draw pause indicator"""
-        pause_text = self.assets.font_game_over.render("PAUSED", True, COLOR_WHITE)
-        instruction_text = self.assets.font_small.render("Press P to Resume", True, COLOR_GRAY)
+        pause_text = text_cache.render("PAUSED", FONT_SIZE_GAME_OVER, COLOR_WHITE)
+        instruction_text = text_cache.render("Press P to Resume", FONT_SIZE_SMALL, COLOR_GRAY)
         
         # Center the text
         pause_rect = pause_text.get_rect(center=(400, 250))
         instruction_rect = instruction_text.get_rect(center=(400, 320))
         
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((800, 600))
-        overlay.set_alpha(128)
-        overlay.fill(COLOR_BLACK)
-        screen.blit(overlay, (0, 0))
+        screen.blit(self.pause_overlay, (0, 0))
         
         screen.blit(pause_text, pause_rect)
         screen.blit(instruction_text, instruction_rect)
         
     def draw_wave_info(self, screen, wave_info):
-        """Draw wave information"""
-        wave_text = self.assets.font_hud.render(f"Wave: {wave_info['number']}", True, COLOR_WHITE)
-        screen.blit(wave_text, (10, 40))
+        """Draw wave information; returns the rects drawn"""
+        wave_text = text_cache.render(f"Wave: {wave_info['number']}", FONT_SIZE_HUD, COLOR_WHITE)
+        rects = [screen.blit(wave_text, (10, 40))]
         
-        if wave_info['in_transition']:
-            transition_text = self.assets.font_small.render(f"Wave {wave_info['number']} Complete!", True, COLOR_YELLOW)
-            next_wave_text = self.assets.font_hud.render(f"Next Wave: {wave_info['number'] + 1}", True, COLOR_WHITE)
-            
-            # Properly center the transition text
-            transition_rect = transition_text.get_rect(center=(400, 250))
-            next_wave_rect = next_wave_text.get_rect(center=(400, 290))
-            
-            # Draw semi-transparent overlay for better visibility
-            overlay = pygame.Surface((800, 600))
-            overlay.set_alpha(64)  # Lighter than pause overlay
-            overlay.fill(COLOR_BLACK)
-            screen.blit(overlay, (0, 0))
-            
-            screen.blit(transition_text, transition_rect)
-            screen.blit(next_wave_text, next_wave_rect)
-        else:
-            enemies_text = self.assets.font_hud.render(f"Enemies: {wave_info['enemies_left']}", True, COLOR_WHITE)
-            screen.blit(enemies_text, (10, 65))
+        if not wave_info['in_transition']:
+            enemies_text = text_cache.render(f"Enemies: {wave_info['enemies_left']}", FONT_SIZE_HUD, COLOR_WHITE)
+            rects.append(screen.blit(enemies_text, (10, 65)))
             
             # Draw progress bar
             progress = wave_info['progress']
-            bar_width = 100
+            bar_width = WAVE_BAR_WIDTH
             bar_height = 8
             bar_x, bar_y = 150, 45
             
@@ -70,69 +107,101 @@ class HUD:
             pygame.draw.rect(screen, COLOR_GRAY, (bar_x, bar_y, bar_width, bar_height))
             # Progress bar
             pygame.draw.rect(screen, COLOR_YELLOW, (bar_x, bar_y, int(bar_width * progress), bar_height))
+            rects.append(pygame.Rect(bar_x, bar_y, bar_width, bar_height))
+        return rects
+        
+    def draw_wave_transition(self, screen, wave_info):
+        """Draw the wave complete overlay"""
+        if wave_info['in_transition']:
+            transition_text = text_cache.render(f"Wave {wave_info['number']} Complete!", FONT_SIZE_SMALL, COLOR_YELLOW)
+            next_wave_text = text_cache.render(f"Next Wave: {wave_info['number'] + 1}", FONT_SIZE_HUD, COLOR_WHITE)
             
-    def draw_combo_info(self, screen, combo_info):
-        """Draw combo multiplier information"""
-        if combo_info['is_active']:
-            # Pulsing effect for active combo
-            self.combo_pulse_time += 1
-            pulse = 1.0 + 0.2 * math.sin(self.combo_pulse_time * 0.2)
+            # Properly center the transition text
+            transition_rect = transition_text.get_rect(center=(400, 250))
+            next_wave_rect = next_wave_text.get_rect(center=(400, 290))
             
-            # Combo multiplier text
-            multiplier_text = f"x{combo_info['multiplier']:.1f}"
-            color = (255, 100, 100) if combo_info['flash'] else COLOR_YELLOW
+            # Draw semi-transparent overlay for better visibility
+            screen.blit(self.transition_overlay, (0, 0))
             
-            # Scale text based on pulse
-            font_size = int(32 * pulse) if combo_info['flash'] else 28
-            combo_font = pygame.font.Font(None, font_size)
+            screen.blit(transition_text, transition_rect)
+            screen.blit(next_wave_text, next_wave_rect)
             
-            mult_surface = combo_font.render(multiplier_text, True, color)
-            screen.blit(mult_surface, (700, 40))
+    def _get_combo_state(self, combo_info):
+        """Reduce combo info to what the combo widget shows (advances the pulse animation)"""
+        if not combo_info['is_active']:
+            return None
+            
+        # Pulsing effect for active combo
+        self.combo_pulse_time += 1
+        pulse = 1.0 + 0.2 * math.sin(self.combo_pulse_time * 0.2)
+        
+        # Combo multiplier text
+        multiplier_text = f"x{combo_info['multiplier']:.1f}"
+        color = (255, 100, 100) if combo_info['flash'] else COLOR_YELLOW
+        
+        # Scale text based on pulse
+        font_size = int(32 * pulse) if combo_info['flash'] else 28
+        
+        # Time remaining bar, in whole pixels
+        time_progress = combo_info['time_left'] / 2500  # 2.5 second window
+        bar_fill = int(COMBO_BAR_WIDTH * time_progress) if combo_info['time_left'] > 0 else None
+        bar_color = COLOR_YELLOW if time_progress > 0.3 else COLOR_RED
+        
+        return multiplier_text, color, font_size, combo_info['combo_count'], bar_fill, bar_color
+        
+    def draw_combo_info(self, screen, combo_state):
+        """Draw combo multiplier information from _get_combo_state; returns the rects drawn"""
+        rects = []
+        if combo_state:
+            multiplier_text, color, font_size, combo_count, bar_fill, bar_color = combo_state
+            mult_surface = text_cache.render(multiplier_text, font_size, color)
+            rects.append(screen.blit(mult_surface, (700, 40)))
             
             # Combo count
-            combo_text = f"Combo: {combo_info['combo_count']}"
-            combo_surface = self.assets.font_hud.render(combo_text, True, COLOR_WHITE)
-            screen.blit(combo_surface, (650, 65))
+            combo_text = f"Combo: {combo_count}"
+            combo_surface = text_cache.render(combo_text, FONT_SIZE_HUD, COLOR_WHITE)
+            rects.append(screen.blit(combo_surface, (650, 65)))
             
             # Time remaining bar
-            if combo_info['time_left'] > 0:
-                time_progress = combo_info['time_left'] / 2500  # 2.5 second window
-                bar_width = 80
+            if bar_fill is not None:
+                bar_width = COMBO_BAR_WIDTH
                 bar_height = 4
                 bar_x, bar_y = 670, 85
                 
                 # Background
                 pygame.draw.rect(screen, COLOR_GRAY, (bar_x, bar_y, bar_width, bar_height))
                 # Time bar
-                color = COLOR_YELLOW if time_progress > 0.3 else COLOR_RED
-                pygame.draw.rect(screen, color, (bar_x, bar_y, int(bar_width * time_progress), bar_height))
+                pygame.draw.rect(screen, bar_color, (bar_x, bar_y, bar_fill, bar_height))
+                rects.append(pygame.Rect(bar_x, bar_y, bar_width, bar_height))
+        return rects
                 
     def draw_game_over(self, screen, score, is_new_high_score=False):
         """Draw game over screen"""
         screen.fill(COLOR_BLACK)
         
-        game_over_text = self.assets.font_game_over.render("GAME OVER", True, COLOR_RED)
+        game_over_text = text_cache.render("GAME OVER", FONT_SIZE_GAME_OVER, COLOR_RED)
         game_over_rect = game_over_text.get_rect(center=(400, 180))
         screen.blit(game_over_text, game_over_rect)
         
-        score_text = self.assets.font_small.render(f"Final Score: {score:,}", True, COLOR_WHITE)
+        score_text = text_cache.render(f"Final Score: {score:,}", FONT_SIZE_SMALL, COLOR_WHITE)
         score_rect = score_text.get_rect(center=(400, 240))
         screen.blit(score_text, score_rect)
         
         # Show high score achievement
         if is_new_high_score:
-            high_score_text = self.assets.font_small.render("🏆 NEW HIGH SCORE! 🏆", True, COLOR_YELLOW)
+            high_score_text = text_cache.render("🏆 NEW HIGH SCORE! 🏆", FONT_SIZE_SMALL, COLOR_YELLOW)
             high_score_rect = high_score_text.get_rect(center=(400, 280))
             screen.blit(high_score_text, high_score_rect)
             
-        restart_text = self.assets.font_hud.render("R - Restart    ESC - Menu    Q - Quit", True, COLOR_GRAY)
+        restart_text = text_cache.render("R - Restart    ESC - Menu    Q - Quit", FONT_SIZE_HUD, COLOR_GRAY)
         restart_rect = restart_text.get_rect(center=(400, 520))
         screen.blit(restart_text, restart_rect)
         
     def draw_active_powerups(self, screen, active_powerups):
-        """Draw active power-up indicators"""
+        """Draw active power-up indicators; returns the rects drawn"""
+        rects = []
         if not active_powerups:
-            return
+            return rects
             
         start_y = 100
         for i, (powerup_type, time_left) in enumerate(active_powerups):
@@ -149,7 +218,7 @@ class HUD:
             }
             
             name = name_map.get(powerup_type.value, powerup_type.value.upper())
-            time_seconds = time_left // 1000
+            time_seconds = int(time_left // 1000)  # Game time is float ms on the fixed-step clock
             
             # Color based on time remaining
             if time_seconds > 3:
@@ -159,5 +228,6 @@ class HUD:
             else:
                 color = COLOR_RED
                 
-            text = self.assets.font_hud.render(f"{name}: {time_seconds}s", True, color)
-            screen.blit(text, (10, y_pos))
\ No newline at end of file
+            text = text_cache.render(f"{name}: {time_seconds}s", FONT_SIZE_HUD, color)
+            rects.append(screen.blit(text, (10, y_pos)))
+        return rects
\ No newline at end of file
@@ -1,8 +1,22 @@
 # Legacy main.py - redirects to new modular game structure
 # Run this file to play the refactored Space Invaders
+# Use --headless TICKS to fast-forward the simulation without a window
 
+import argparse
 from game import Game
+from settings import SIMULATION_HZ
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Space Invaders: Retro Edition")
+    parser.add_argument("--headless", type=int, metavar="TICKS",
+                        help="simulate TICKS updates without a window and report ticks per second")
+    parser.add_argument("--delta", type=float, default=1000 / SIMULATION_HZ, metavar="MS",
+                        help="simulated milliseconds per headless tick (default: one simulation step)")
+    args = parser.parse_args()
+    
+    if args.headless:
+        game = Game(headless=True)
+        game.run_headless(args.headless, args.delta)
+    else:
+        game = Game()
+        game.run()
\ No newline at end of file
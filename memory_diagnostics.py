@@ -0,0 +1,160 @@
+# Per-wave memory diagnostics for soak runs
+# Snapshots tracemalloc and gc object counts at every WaveManager.start_next_wave, reports
+# growth by file and line, and flags anything that keeps growing wave after wave as a leak
+# Usage: python memory_diagnostics.py [--ticks N] [--seed S] [--no-draw]
+
+import argparse
+import gc
+import random
+import tracemalloc
+from collections import Counter
+import pygame
+from game import Game
+from game_states import GameState
+from profile_game import scripted_keys
+from settings import SIMULATION_HZ, MEMORY_TRACE_FRAMES, MEMORY_REPORT_TOP, MEMORY_LEAK_WAVES, MEMORY_LEAK_MIN_BYTES
+
+# Classes whose live instances are counted at every snapshot (bullets are pool slots, counted separately)
+TRACKED_TYPES = ("Enemy", "PowerUp", "ActivePowerUp")
+
+class MemoryDiagnostics:
+    def __init__(self, game, top=MEMORY_REPORT_TOP, leak_waves=MEMORY_LEAK_WAVES):
+        """
+        Memory snapshots taken at the start of every wave
+        A counter or source line that grows across leak_waves consecutive snapshots is reported as a leak
+        """
+        self.game = game
+        self.top = top
+        self.leak_waves = leak_waves
+        self.snapshots = []  # One record per wave start
+        self.line_sizes = []  # Per snapshot: "file:line" -> traced bytes
+        self.previous = None
+        self.leaks = {}  # Suspect -> message, reported once per suspect
+        
+    def start(self):
+        """Start tracing allocations"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(MEMORY_TRACE_FRAMES)
+            
+    def stop(self):
+        """Stop tracing allocations"""
+        tracemalloc.stop()
+        
+    def snapshot(self, wave_number):
+        """Record memory at the start of a wave (WaveManager's on_wave_start callback)"""
+        gc.collect()  # Count only what is still reachable
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),  # The diagnostics' own records
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        peak = tracemalloc.get_traced_memory()[1]
+        
+        growth = []
+        if self.previous is not None:
+            for stat in snapshot.compare_to(self.previous, "lineno")[:self.top]:
+                growth.append({"line": str(stat.traceback[0]), "size_diff": stat.size_diff,
+                               "count_diff": stat.count_diff})
+        self.previous = snapshot
+        line_sizes = {str(stat.traceback[0]): stat.size for stat in snapshot.statistics("lineno")}
+        self.line_sizes.append(line_sizes)
+        
+        record = {
+            "wave": wave_number,
+            "traced_bytes": sum(line_sizes.values()),  # Excluding the diagnostics' own records
+            "peak_bytes": peak,
+            "gc_objects": len(gc.get_objects()),  # Reported only; it legitimately grows as caches warm up
+            "objects": self.count_objects(),
+            "growth": growth
+        }
+        self.snapshots.append(record)
+        self._detect_leaks()
+        return record
+        
+    def count_objects(self):
+        """Count live game objects and the entries of long-lived containers"""
+        counts = Counter()
+        for obj in gc.get_objects():
+            name = type(obj).__name__
+            if name in TRACKED_TYPES:
+                counts[name] += 1
+        game = self.game
+        for name, pool in (("player", game.bullet_manager.player_bullets), ("enemy", game.bullet_manager.enemy_bullets)):
+            counts[f"{name} bullets"] = pool.active_count
+            counts[f"{name} bullet capacity"] = pool.capacity
+        counts["particles"] = game.particle_system.get_count()
+        counts["score popup dicts"] = len(game.particle_system.popups)
+        counts["dodge_bonuses_given"] = len(game.dodge_bonuses_given)
+        spawner = game.enemy_spawner
+        counts["spawner existing_positions"] = len(spawner.existing_positions)
+        # One position is recorded per tracked enemy, so anything left over was never released
+        counts["spawner stale positions"] = len(spawner.existing_positions) - len(spawner.enemies)
+        return dict(counts)
+        
+    def _detect_leaks(self):
+        """Flag counters and source lines that grew at each of the last leak_waves snapshots"""
+        if len(self.snapshots) <= self.leak_waves:
+            return
+            
+        recent = self.snapshots[-self.leak_waves - 1:]
+        for name in recent[-1]["objects"]:
+            values = [record["objects"].get(name, 0) for record in recent]
+            if all(later > earlier for earlier, later in zip(values, values[1:])):
+                self.leaks.setdefault(name, f"{name} grew for {self.leak_waves} waves: {values}")
+                
+        recent_sizes = self.line_sizes[-self.leak_waves - 1:]
+        for line, size in recent_sizes[-1].items():
+            sizes = [sizes.get(line, 0) for sizes in recent_sizes]
+            if (size - sizes[0] >= MEMORY_LEAK_MIN_BYTES and
+                    all(later > earlier for earlier, later in zip(sizes, sizes[1:]))):
+                self.leaks.setdefault(line, f"{line} grew for {self.leak_waves} waves: {sizes[0]} -> {size} bytes")
+                
+    def print_report(self):
+        """Print the per-wave snapshots and any suspected leaks"""
+        for record in self.snapshots:
+            objects = ", ".join(f"{name} {count}" for name, count in sorted(record["objects"].items()))
+            print(f"Wave {record['wave']}: {record['traced_bytes'] / 1024:.0f} KiB traced "
+                  f"(peak {record['peak_bytes'] / 1024:.0f} KiB), {record['gc_objects']} gc objects; {objects}")
+            for stat in record["growth"]:
+                print(f"    {stat['size_diff'] / 1024:+8.1f} KiB {stat['count_diff']:+6d} blocks  {stat['line']}")
+                
+        if self.leaks:
+            print(f"Suspected leaks ({len(self.leaks)}):")
+            for message in self.leaks.values():
+                print(f"    {message}")
+        else:
+            print("No suspected leaks")
+
+def soak(ticks, seed, draw=True):
+    """Play a long scripted session with memory diagnostics; returns the diagnostics"""
+    random.seed(seed)  # The game seeds its own NumPy generators from this
+    game = Game(headless=True)
+    diagnostics = MemoryDiagnostics(game)
+    diagnostics.start()
+    game.on_wave_start = diagnostics.snapshot
+    game.reset_game()  # Recreates the wave manager with the callback
+    step = 1000 / SIMULATION_HZ
+    
+    for tick in range(ticks):
+        pygame.event.pump()
+        game.game_clock.tick(step)
+        game.update(step, scripted_keys(tick))
+        if draw:
+            game.draw()
+        if game.state == GameState.GAME_OVER:
+            game.reset_game()
+            
+    diagnostics.stop()
+    pygame.quit()
+    return diagnostics
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soak run with per-wave memory snapshots and leak detection")
+    parser.add_argument("--ticks", type=int, default=36000, help="ticks to simulate (default: 36000, 10 minutes)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed (default: 1)")
+    parser.add_argument("--no-draw", action="store_true", help="skip drawing (simulation-only soak)")
+    args = parser.parse_args()
+    
+    diagnostics = soak(args.ticks, args.seed, draw=not args.no_draw)
+    diagnostics.print_report()
+    raise SystemExit(1 if diagnostics.leaks else 0)
\ No newline at end of file
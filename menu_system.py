@@ -3,20 +3,21 @@ import json
 import os
 import math
 from datetime import datetime
+from text_cache import text_cache
 from settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_YELLOW, COLOR_WHITE, 
     COLOR_RED, COLOR_GRAY, COLOR_BLACK
 )
 
 class HighScoreManager:
-    def __init__(self):
-        self.scores_file = "high_score.json"
+    def __init__(self, scores_file="high_score.json"):
+        self.scores_file = scores_file  # None keeps scores in memory only
         self.high_score_data = self.load_high_score()
         
     def load_high_score(self):
         """Load high score from file"""
         try:
-            if os.path.exists(self.scores_file):
+            if self.scores_file and os.path.exists(self.scores_file):
                 with open(self.scores_file, 'r') as f:
                     return json.load(f)
         except:
@@ -25,6 +26,9 @@ class HighScoreManager:
         
     def save_high_score(self):
         """Save high score to file"""
+        if not self.scores_file:
+            return
+            
         try:
             with open(self.scores_file, 'w') as f:
                 json.dump(self.high_score_data, f, indent=2)
@@ -66,11 +70,11 @@ class RetroMenu:
         self.title_glow = 0
         self.show_high_scores = False
         
-        # Create retro fonts
-        self.title_font = pygame.font.Font(None, 72)
-        self.menu_font = pygame.font.Font(None, 48)
-        self.small_font = pygame.font.Font(None, 32)
-        self.tiny_font = pygame.font.Font(None, 24)
+        # Retro font sizes (fonts and rendered text come from the shared text cache)
+        self.title_font_size = 72
+        self.menu_font_size = 48
+        self.small_font_size = 32
+        self.tiny_font_size = 24
         
     def _generate_stars(self):
         """Generate background stars for retro effect"""
@@ -141,29 +145,29 @@ class RetroMenu:
             int(100 * (0.5 + 0.5 * self.title_glow))
         )
         
-        title_text = self.title_font.render("SPACE INVADERS", True, title_color)
+        title_text = text_cache.render("SPACE INVADERS", self.title_font_size, title_color)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 120))
         screen.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_text = self.small_font.render("RETRO EDITION", True, COLOR_GRAY)
+        subtitle_text = text_cache.render("RETRO EDITION", self.small_font_size, COLOR_GRAY)
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, 160))
         screen.blit(subtitle_text, subtitle_rect)
         
         # High score display
         high_score_info = self.high_score_manager.get_high_score_info()
         if high_score_info["score"] > 0:
-            high_score_text = self.small_font.render(f"HIGH SCORE: {high_score_info['score']:,}", True, COLOR_YELLOW)
+            high_score_text = text_cache.render(f"HIGH SCORE: {high_score_info['score']:,}", self.small_font_size, COLOR_YELLOW)
             high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
             screen.blit(high_score_text, high_score_rect)
             
             # Show wave and date info
-            wave_text = self.tiny_font.render(f"Wave {high_score_info['wave']} • {high_score_info['date']}", True, COLOR_GRAY)
+            wave_text = text_cache.render(f"Wave {high_score_info['wave']} • {high_score_info['date']}", self.tiny_font_size, COLOR_GRAY)
             wave_rect = wave_text.get_rect(center=(SCREEN_WIDTH // 2, 220))
             screen.blit(wave_text, wave_rect)
         else:
             # No high score yet
-            no_score_text = self.small_font.render("No high score yet - Play to set one!", True, COLOR_GRAY)
+            no_score_text = text_cache.render("No high score yet - Play to set one!", self.small_font_size, COLOR_GRAY)
             no_score_rect = no_score_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
             screen.blit(no_score_text, no_score_rect)
             
@@ -176,21 +180,20 @@ class RetroMenu:
             if i == self.selected_option:
                 # Pulsing selection
                 pulse = 1.0 + 0.1 * math.sin(self.animation_time * 0.01)
-                font_size = int(48 * pulse)
-                option_font = pygame.font.Font(None, font_size)
+                font_size = int(self.menu_font_size * pulse)
                 
                 # Selection arrows
-                arrow_text = self.menu_font.render(">", True, COLOR_YELLOW)
+                arrow_text = text_cache.render(">", self.menu_font_size, COLOR_YELLOW)
                 arrow_rect = arrow_text.get_rect(center=(SCREEN_WIDTH // 2 - 120, menu_start_y + i * 60))
                 screen.blit(arrow_text, arrow_rect)
                 
-                arrow_text2 = self.menu_font.render("<", True, COLOR_YELLOW)
+                arrow_text2 = text_cache.render("<", self.menu_font_size, COLOR_YELLOW)
                 arrow_rect2 = arrow_text2.get_rect(center=(SCREEN_WIDTH // 2 + 120, menu_start_y + i * 60))
                 screen.blit(arrow_text2, arrow_rect2)
             else:
-                option_font = self.menu_font
+                font_size = self.menu_font_size
                 
-            option_text = option_font.render(option, True, color)
+            option_text = text_cache.render(option, font_size, color)
             option_rect = option_text.get_rect(center=(SCREEN_WIDTH // 2, menu_start_y + i * 60))
             screen.blit(option_text, option_rect)
             
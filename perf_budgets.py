@@ -0,0 +1,38 @@
+# Performance budgets for the hot paths, checked by perf_gate.py
+# Timings are per-tick p95 milliseconds of FrameProfiler phases in benchmark.py scenarios
+
+import os
+
+# Baseline comparison. The baseline holds absolute timings from the machine that recorded it,
+# so re-record it (perf_gate.py --update-baseline) on each machine before gating there
+PERF_BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_baseline.json")
+PERF_TOLERANCE = 0.25  # Fail when a phase's p95 is this much slower than the baseline (0.25 = 25%)
+PERF_MIN_REGRESSION_MS = 0.05  # Ignore smaller absolute slowdowns, which are timer noise
+PERF_GATE_TICKS = 600  # Measured ticks per scenario
+PERF_GATE_SEED = 1
+PERF_GATE_REPEATS = 5  # Runs per gate; each phase keeps its fastest p95, as machine noise only adds time
+PERF_GATE_MIN_REPEATS = 5  # Fastest p95s drifted by up to 34% over 1 run, 28% over 3 and 16% over 5
+
+# Absolute p95 budgets (ms) per scenario and subsystem phase; these phases are also baseline-compared
+PERF_BUDGETS = {
+    "baseline": {
+        "draw.hud": 1.0,  # HUD draw
+    },
+    "enemies_100": {
+        "update.collisions": 6.0,  # Collision
+        "update.enemies": 3.0,  # Enemy AI (movement)
+        "update.enemy_shooting": 1.0,  # Enemy AI (aiming and firing)
+        "draw.hud": 3.0,  # Includes the wave transition overlay
+    },
+    "enemy_bullets_2000": {
+        "update.bullets": 1.0,
+        "update.collisions": 6.0,  # Dodge-range filtering of every enemy bullet
+    },
+    "particles_5000": {
+        "update.particles": 1.0,  # Particles
+        "draw.particles": 20.0,
+    },
+    "powerups_all": {
+        "draw.world": 2.0,
+    },
+}
\ No newline at end of file
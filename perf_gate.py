@@ -0,0 +1,84 @@
+# Local performance regression gate
+# Runs the benchmark scenarios named in perf_budgets.py and compares every phase's p95 with
+# the committed baseline and with its absolute budget; exits non-zero on any failure
+# Usage: python perf_gate.py [--update-baseline] [--report PATH] [--tolerance FRACTION]
+
+import argparse
+import json
+import sys
+from benchmark import run_benchmark
+from perf_budgets import (
+    PERF_BASELINE_FILE, PERF_TOLERANCE, PERF_MIN_REGRESSION_MS, PERF_GATE_TICKS, PERF_GATE_SEED,
+    PERF_GATE_REPEATS, PERF_GATE_MIN_REPEATS, PERF_BUDGETS
+)
+
+def run_gate_benchmark(ticks, repeats):
+    """Run the budgeted scenarios repeats times; returns a report of the best p95 per phase"""
+    runs = [run_benchmark(list(PERF_BUDGETS), ticks, 60, PERF_GATE_SEED) for _ in range(repeats)]
+    scenarios = {}
+    for scenario in PERF_BUDGETS:
+        phases = runs[0]["scenarios"][scenario]["phases_ms"]
+        scenarios[scenario] = {"phases_ms": {
+            phase: {"p95": min(run["scenarios"][scenario]["phases_ms"][phase]["p95"] for run in runs)}
+            for phase in phases
+        }}
+    return {"seed": PERF_GATE_SEED, "ticks": ticks, "repeats": repeats, "scenarios": scenarios}
+
+def compare(report, baseline, tolerance=PERF_TOLERANCE, budgets=PERF_BUDGETS):
+    """Check a benchmark report against a baseline report and the budgets; returns failure messages"""
+    failures = []
+    for scenario, phase_budgets in budgets.items():
+        phases = report["scenarios"].get(scenario, {}).get("phases_ms")
+        if phases is None:
+            failures.append(f"{scenario}: missing from the report")
+            continue
+        baseline_phases = baseline["scenarios"].get(scenario, {}).get("phases_ms", {})
+        
+        for phase, budget in phase_budgets.items():
+            if phase not in phases:
+                failures.append(f"{scenario} {phase}: budgeted phase was never timed")
+                continue
+                
+            p95 = phases[phase]["p95"]
+            if p95 > budget:
+                failures.append(f"{scenario} {phase}: p95 {p95:.3f} ms over budget {budget:.3f} ms")
+                
+            if phase in baseline_phases:
+                baseline_p95 = baseline_phases[phase]["p95"]
+                if p95 > baseline_p95 * (1 + tolerance) and p95 - baseline_p95 > PERF_MIN_REGRESSION_MS:
+                    failures.append(f"{scenario} {phase}: p95 {p95:.3f} ms vs baseline {baseline_p95:.3f} ms "
+                                    f"({p95 / baseline_p95 - 1:+.0%}, tolerance {tolerance:.0%})")
+    return failures
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare benchmark p95 timings with the baseline and budgets")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--report", help="compare an existing report (from benchmark.py or this tool) instead")
+    parser.add_argument("--baseline", default=PERF_BASELINE_FILE, help="baseline report path")
+    parser.add_argument("--tolerance", type=float, default=PERF_TOLERANCE,
+                        help=f"allowed p95 regression as a fraction (default: {PERF_TOLERANCE})")
+    parser.add_argument("--ticks", type=int, default=PERF_GATE_TICKS, help="measured ticks per scenario")
+    parser.add_argument("--repeats", type=int, default=PERF_GATE_REPEATS, help="benchmark runs; each phase keeps its fastest p95")
+    args = parser.parse_args()
+    if not args.report and args.repeats < PERF_GATE_MIN_REPEATS:
+        parser.error(f"--repeats must be at least {PERF_GATE_MIN_REPEATS}; fewer runs are too noisy to gate on")
+        
+    if args.report:
+        with open(args.report) as f:
+            report = json.load(f)
+    else:
+        report = run_gate_benchmark(args.ticks, args.repeats)
+        
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        sys.exit(0)
+        
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    failures = compare(report, baseline, args.tolerance)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print(f"Performance gate {'failed' if failures else 'passed'} ({len(failures)} failures)")
+    sys.exit(1 if failures else 0)
\ No newline at end of file
@@ -5,11 +5,13 @@ class Player:
     def __init__(self, assets):
         self.x = PLAYER_START_X
         self.y = PLAYER_START_Y
+        self.prev_x = self.x  # Position at the previous simulation step (for interpolation)
         self.speed = PLAYER_SPEED
         self.assets = assets
         
     def update(self, keys, delta_time, speed_multiplier=1.0):
         """Update player position based on input"""
+        self.prev_x = self.x
         x_change = 0
         
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
@@ -33,7 +35,12 @@ class Player:
         """Get player position"""
         return self.x, self.y
         
+    def get_render_position(self, alpha=1.0):
+        """Get position interpolated between the last two simulation steps"""
+        return self.prev_x + (self.x - self.prev_x) * alpha, self.y
+        
     def reset(self):
         """Reset player to starting position"""
         self.x = PLAYER_START_X
-        self.y = PLAYER_START_Y
\ No newline at end of file
+        self.y = PLAYER_START_Y
+        self.prev_x = self.x
\ No newline at end of file
@@ -2,7 +2,8 @@ import pygame
 import random
 import math
 from enum import Enum
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_YELLOW, COLOR_WHITE, COLOR_RED
+from text_cache import text_cache
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_YELLOW, COLOR_WHITE, COLOR_RED, POWERUP_SIZE
 
 class PowerUpType(Enum):
     RAPID_FIRE = "rapid_fire"
@@ -15,43 +16,48 @@ class PowerUpType(Enum):
     BULLET_TIME = "bullet_time"
 
 class PowerUp:
-    def __init__(self, x, y, powerup_type):
+    # Pre-rasterized shape and symbol, keyed by (type, pulse size)
+    sprite_cache = {}
+    
+    def __init__(self, x, y, powerup_type, current_time):
         self.x = x
         self.y = y
+        self.prev_y = y  # Position at the previous simulation step (for interpolation)
         self.type = powerup_type
         self.active = True
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = current_time
         self.lifetime = 8000  # 8 seconds before despawn
-        self.size = 20
+        self.size = POWERUP_SIZE
         self.pulse_time = 0
         self.float_offset = random.uniform(0, math.pi * 2)
         
         # Visual properties based on type
-        self.color, self.shape, self.symbol = self._get_visual_properties()
+        self.color, self.shape, self.symbol = self._get_visual_properties(powerup_type)
         
-    def _get_visual_properties(self):
+    @staticmethod
+    def _get_visual_properties(powerup_type):
         """Get color, shape, and symbol for each power-up type"""
-        if self.type == PowerUpType.RAPID_FIRE:
+        if powerup_type == PowerUpType.RAPID_FIRE:
             return (255, 100, 100), "circle", "R"  # Red circle
-        elif self.type == PowerUpType.SHIELD:
+        elif powerup_type == PowerUpType.SHIELD:
             return (100, 150, 255), "hexagon", "S"  # Blue hexagon
-        elif self.type == PowerUpType.MULTI_SHOT:
+        elif powerup_type == PowerUpType.MULTI_SHOT:
             return (255, 255, 100), "triangle", "M"  # Yellow triangle
-        elif self.type == PowerUpType.SPEED_BOOST:
+        elif powerup_type == PowerUpType.SPEED_BOOST:
             return (100, 255, 100), "diamond", "+"  # Green diamond
-        elif self.type == PowerUpType.SCREEN_CLEAR:
+        elif powerup_type == PowerUpType.SCREEN_CLEAR:
             return (255, 150, 0), "star", "!"  # Orange star
-        elif self.type == PowerUpType.SCORE_MULTIPLIER:
+        elif powerup_type == PowerUpType.SCORE_MULTIPLIER:
             return (255, 100, 255), "square", "X"  # Purple square
         # New advanced power-ups
-        elif self.type == PowerUpType.BULLET_TIME:
+        elif powerup_type == PowerUpType.BULLET_TIME:
             return (100, 255, 255), "hourglass", "T"  # Cyan hourglass
         else:
             return (255, 255, 255), "circle", "?"
             
-    def update(self, delta_time, bg_speed=None):
+    def update(self, delta_time, current_time, bg_speed=None):
         """Update power-up animation and lifetime"""
-        current_time = pygame.time.get_ticks()
+        self.prev_y = self.y
         self.pulse_time += delta_time
         
         # Fall down towards player (same speed as background + a bit extra)
@@ -71,68 +77,107 @@ class PowerUp:
         if current_time - self.spawn_time > self.lifetime:
             self.active = False
             
-    def draw(self, screen):
+    def draw(self, screen, current_time, alpha=1.0):
         """Draw the power-up with pulsing animation"""
-        if not self.active:
+        render_state = self.get_render_state(current_time, alpha)
+        if render_state is None:
             return
             
+        size, center = render_state
+        sprite = self.get_sprite(self.type, size)
+        screen.blit(sprite, sprite.get_rect(center=center))
+        
+    def get_render_state(self, current_time, alpha=1.0):
+        """Get the pulse size and screen center to draw at, or None when hidden"""
+        if not self.active:
+            return None
+            
         # Pulsing effect
         pulse = 1.0 + 0.3 * math.sin(self.pulse_time * 0.01)
         current_size = int(self.size * pulse)
         
         # Blinking effect when about to expire
-        current_time = pygame.time.get_ticks()
         time_left = self.lifetime - (current_time - self.spawn_time)
         if time_left < 2000:  # Last 2 seconds
             blink_rate = max(0.1, time_left / 2000)  # Faster blinking as time runs out
             if math.sin(current_time * 0.01) > blink_rate:
-                return  # Skip drawing (blink effect)
+                return None  # Skip drawing (blink effect)
                 
-        # Draw shape based on type
-        center = (int(self.x), int(self.y))
-        
-        if self.shape == "circle":
-            pygame.draw.circle(screen, self.color, center, current_size)
-            pygame.draw.circle(screen, COLOR_WHITE, center, current_size, 2)
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return current_size, (int(self.x), int(y))
+        
+    @staticmethod
+    def sprite_name(powerup_type, size):
+        """Get the sprite atlas name of a power-up at a pulse size"""
+        return f"powerup_{powerup_type.value}_{size}"
+        
+    @classmethod
+    def get_sprite(cls, powerup_type, size):
+        """Get the cached sprite for a power-up type at a pulse size, rasterizing it on first use"""
+        key = (powerup_type, size)
+        sprite = cls.sprite_cache.get(key)
+        if sprite is None:
+            sprite = cls._render_sprite(powerup_type, size)
+            cls.sprite_cache[key] = sprite
+        return sprite
+        
+    @classmethod
+    def warm_sprite_cache(cls):
+        """Rasterize every type at every pulse size up front, so the first spawn doesn't hitch"""
+        for powerup_type in PowerUpType:
+            for size in range(int(POWERUP_SIZE * 0.7) - 1, int(POWERUP_SIZE * 1.3) + 1):
+                cls.get_sprite(powerup_type, size)
+                
+    @classmethod
+    def _render_sprite(cls, powerup_type, size):
+        """Draw a power-up's shape and symbol onto a transparent surface centered on it"""
+        color, shape, symbol = cls._get_visual_properties(powerup_type)
+        half = size + 2  # Room for the 2px outline
+        sprite = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+        center = (half, half)
+        
+        if shape == "circle":
+            pygame.draw.circle(sprite, color, center, size)
+            pygame.draw.circle(sprite, COLOR_WHITE, center, size, 2)
             
-        elif self.shape == "hexagon":
-            points = self._get_hexagon_points(center, current_size)
-            pygame.draw.polygon(screen, self.color, points)
-            pygame.draw.polygon(screen, COLOR_WHITE, points, 2)
+        elif shape == "hexagon":
+            points = cls._get_hexagon_points(center, size)
+            pygame.draw.polygon(sprite, color, points)
+            pygame.draw.polygon(sprite, COLOR_WHITE, points, 2)
             
-        elif self.shape == "triangle":
-            points = self._get_triangle_points(center, current_size)
-            pygame.draw.polygon(screen, self.color, points)
-            pygame.draw.polygon(screen, COLOR_WHITE, points, 2)
+        elif shape == "triangle":
+            points = cls._get_triangle_points(center, size)
+            pygame.draw.polygon(sprite, color, points)
+            pygame.draw.polygon(sprite, COLOR_WHITE, points, 2)
             
-        elif self.shape == "diamond":
-            points = self._get_diamond_points(center, current_size)
-            pygame.draw.polygon(screen, self.color, points)
-            pygame.draw.polygon(screen, COLOR_WHITE, points, 2)
+        elif shape == "diamond":
+            points = cls._get_diamond_points(center, size)
+            pygame.draw.polygon(sprite, color, points)
+            pygame.draw.polygon(sprite, COLOR_WHITE, points, 2)
             
-        elif self.shape == "star":
-            points = self._get_star_points(center, current_size)
-            pygame.draw.polygon(screen, self.color, points)
-            pygame.draw.polygon(screen, COLOR_WHITE, points, 2)
+        elif shape == "star":
+            points = cls._get_star_points(center, size)
+            pygame.draw.polygon(sprite, color, points)
+            pygame.draw.polygon(sprite, COLOR_WHITE, points, 2)
             
-        elif self.shape == "square":
-            rect = pygame.Rect(center[0] - current_size, center[1] - current_size, 
-                             current_size * 2, current_size * 2)
-            pygame.draw.rect(screen, self.color, rect)
-            pygame.draw.rect(screen, COLOR_WHITE, rect, 2)
+        elif shape == "square":
+            rect = pygame.Rect(center[0] - size, center[1] - size, 
+                             size * 2, size * 2)
+            pygame.draw.rect(sprite, color, rect)
+            pygame.draw.rect(sprite, COLOR_WHITE, rect, 2)
             
-        elif self.shape == "hourglass":
-            points = self._get_hourglass_points(center, current_size)
-            pygame.draw.polygon(screen, self.color, points)
-            pygame.draw.polygon(screen, COLOR_WHITE, points, 2)
+        elif shape == "hourglass":
+            points = cls._get_hourglass_points(center, size)
+            pygame.draw.polygon(sprite, color, points)
+            pygame.draw.polygon(sprite, COLOR_WHITE, points, 2)
             
         # Draw symbol
-        font = pygame.font.Font(None, max(16, current_size))
-        text = font.render(self.symbol, True, COLOR_WHITE)
-        text_rect = text.get_rect(center=center)
-        screen.blit(text, text_rect)
+        text = text_cache.render(symbol, max(16, size), COLOR_WHITE)
+        sprite.blit(text, text.get_rect(center=center))
+        return sprite
         
-    def _get_hexagon_points(self, center, size):
+    @staticmethod
+    def _get_hexagon_points(center, size):
         """Generate hexagon points"""
         points = []
         for i in range(6):
@@ -142,7 +187,8 @@ class PowerUp:
             points.append((x, y))
         return points
         
-    def _get_triangle_points(self, center, size):
+    @staticmethod
+    def _get_triangle_points(center, size):
         """Generate triangle points"""
         return [
             (center[0], center[1] - size),
@@ -150,7 +196,8 @@ class PowerUp:
             (center[0] + size * 0.866, center[1] + size * 0.5)
         ]
         
-    def _get_diamond_points(self, center, size):
+    @staticmethod
+    def _get_diamond_points(center, size):
         """Generate diamond points"""
         return [
             (center[0], center[1] - size),
@@ -159,7 +206,8 @@ class PowerUp:
             (center[0] - size, center[1])
         ]
         
-    def _get_star_points(self, center, size):
+    @staticmethod
+    def _get_star_points(center, size):
         """Generate star points"""
         points = []
         for i in range(10):
@@ -170,7 +218,8 @@ class PowerUp:
             points.append((x, y))
         return points
         
-    def _get_hourglass_points(self, center, size):
+    @staticmethod
+    def _get_hourglass_points(center, size):
         """Generate hourglass points"""
         return [
             (center[0] - size, center[1] - size),      # Top left
@@ -181,9 +230,6 @@ class PowerUp:
             (center[0] - size * 0.3, center[1])       # Middle left
         ]
         
-
-
-        
     def get_position(self):
         """Get power-up position"""
         return self.x, self.y
@@ -197,21 +243,19 @@ class PowerUp:
         self.active = False
 
 class ActivePowerUp:
-    def __init__(self, powerup_type, duration):
+    def __init__(self, powerup_type, duration, start_time):
         self.type = powerup_type
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = start_time
         self.duration = duration
         self.active = True
         
-    def update(self):
+    def update(self, current_time):
         """Update active power-up"""
-        current_time = pygame.time.get_ticks()
         if current_time - self.start_time > self.duration:
             self.active = False
             
-    def get_time_left(self):
+    def get_time_left(self, current_time):
         """Get remaining time in milliseconds"""
-        current_time = pygame.time.get_ticks()
         elapsed = current_time - self.start_time
         return max(0, self.duration - elapsed)
         
@@ -239,10 +283,8 @@ class PowerUpManager:
             PowerUpType.BULLET_TIME: 5000      # 5 seconds
         }
         
-    def try_spawn_powerup(self, enemy_x, enemy_y):
+    def try_spawn_powerup(self, enemy_x, enemy_y, current_time):
         """Try to spawn a power-up at enemy death location"""
-        current_time = pygame.time.get_ticks()
-        
         # Check spawn conditions
         if (random.random() < self.spawn_chance and 
             current_time - self.last_spawn_time > 3000):  # Min 3 seconds between spawns
@@ -251,7 +293,7 @@ class PowerUpManager:
             powerup_type = self._select_powerup_type()
             
             # Create power-up slightly above enemy position
-            powerup = PowerUp(enemy_x, enemy_y - 20, powerup_type)
+            powerup = PowerUp(enemy_x, enemy_y - 20, powerup_type, current_time)
             self.powerups.append(powerup)
             self.last_spawn_time = current_time
             
@@ -283,21 +325,21 @@ class PowerUpManager:
                 
         return PowerUpType.RAPID_FIRE  # Fallback
         
-    def update(self, delta_time, bg_speed=None):
+    def update(self, delta_time, current_time, bg_speed=None):
         """Update all power-ups"""
         # Update pickup power-ups
         for powerup in self.powerups[:]:
-            powerup.update(delta_time, bg_speed)
+            powerup.update(delta_time, current_time, bg_speed)
             if not powerup.is_active():
                 self.powerups.remove(powerup)
                 
         # Update active power-ups
         for active_powerup in self.active_powerups[:]:
-            active_powerup.update()
+            active_powerup.update(current_time)
             if not active_powerup.is_active():
                 self.active_powerups.remove(active_powerup)
                 
-    def check_collection(self, player_x, player_y, collection_radius=30):
+    def check_collection(self, player_x, player_y, current_time, collection_radius=30):
         """Check if player collected any power-ups"""
         collected = []
         
@@ -311,11 +353,11 @@ class PowerUpManager:
                 collected.append(powerup.type)
                 
                 # Activate power-up
-                self._activate_powerup(powerup.type)
+                self._activate_powerup(powerup.type, current_time)
                 
         return collected
         
-    def _activate_powerup(self, powerup_type):
+    def _activate_powerup(self, powerup_type, current_time):
         """Activate a collected power-up"""
         duration = self.durations[powerup_type]
         
@@ -324,21 +366,37 @@ class PowerUpManager:
         
         # Add new active power-up
         if duration > 0:  # Not instant
-            active_powerup = ActivePowerUp(powerup_type, duration)
+            active_powerup = ActivePowerUp(powerup_type, duration, current_time)
             self.active_powerups.append(active_powerup)
             
-    def draw(self, screen):
-        """Draw all power-ups"""
+    def draw(self, screen, current_time, alpha=1.0, atlas=None):
+        """Draw all power-ups, batched from the sprite atlas when given"""
+        if atlas is None:
+            for powerup in self.powerups:
+                powerup.draw(screen, current_time, alpha)
+            return
+            
+        batch = []
         for powerup in self.powerups:
-            powerup.draw(screen)
+            render_state = powerup.get_render_state(current_time, alpha)
+            if render_state is None:
+                continue
+            size, (center_x, center_y) = render_state
+            name = PowerUp.sprite_name(powerup.type, size)
+            if name in atlas:
+                area = atlas.get_rect(name)
+                batch.append((atlas.surface, (center_x - area.width // 2, center_y - area.height // 2), area))
+            else:
+                powerup.draw(screen, current_time, alpha)  # Pulse size outside the packed range
+        screen.blits(batch, False)
             
     def is_active(self, powerup_type):
         """Check if a specific power-up type is currently active"""
         return any(p.type == powerup_type and p.is_active() for p in self.active_powerups)
         
-    def get_active_powerups(self):
+    def get_active_powerups(self, current_time):
         """Get list of currently active power-ups with time remaining"""
-        return [(p.type, p.get_time_left()) for p in self.active_powerups if p.is_active()]
+        return [(p.type, p.get_time_left(current_time)) for p in self.active_powerups if p.is_active()]
         
     def clear_all(self):
         """Clear all power-ups"""
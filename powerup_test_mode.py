@@ -1,19 +1,26 @@
 import pygame
 from powerup_system import PowerUpType, PowerUp
+from text_cache import text_cache
 from settings import COLOR_WHITE, COLOR_YELLOW, COLOR_RED, COLOR_GRAY, SCREEN_HEIGHT, SCREEN_WIDTH
 
 class PowerUpTestMode:
-    def __init__(self, powerup_manager, assets):
+    def __init__(self, powerup_manager, assets, game_clock):
         self.powerup_manager = powerup_manager
         self.assets = assets
+        self.game_clock = game_clock
         self.active = False
         self.selected_powerup = 0
         self.powerup_list = list(PowerUpType)
         self.spawn_position = (400, 100)  # Center top of screen
         
-        # Create font for test UI
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 20)
+        # Font sizes for test UI
+        self.font_size = 24
+        self.small_font_size = 20
+        
+        # Semi-transparent panel background, allocated once
+        self.panel = pygame.Surface((300, 400))
+        self.panel.set_alpha(200)
+        self.panel.fill((0, 0, 0))
         
     def toggle(self):
         """Toggle test mode on/off"""
@@ -54,12 +61,14 @@ class PowerUpTestMode:
         
     def spawn_powerup(self, powerup_type):
         """Spawn a specific power-up at test position"""
-        powerup = PowerUp(self.spawn_position[0], self.spawn_position[1], powerup_type)
+        powerup = PowerUp(self.spawn_position[0], self.spawn_position[1], powerup_type,
+                          self.game_clock.get_time())
         self.powerup_manager.powerups.append(powerup)
         
     def spawn_all_powerups(self):
         """Spawn all power-up types in a grid"""
         self.powerup_manager.powerups.clear()  # Clear existing first
+        current_time = self.game_clock.get_time()
         
         cols = 4
         start_x = 200
@@ -73,7 +82,7 @@ class PowerUpTestMode:
             x = start_x + col * spacing_x
             y = start_y + row * spacing_y
             
-            powerup = PowerUp(x, y, powerup_type)
+            powerup = PowerUp(x, y, powerup_type, current_time)
             self.powerup_manager.powerups.append(powerup)
             
     def draw_ui(self, screen):
@@ -82,13 +91,10 @@ class PowerUpTestMode:
             return
             
         # Semi-transparent background
-        overlay = pygame.Surface((300, 400))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (10, 10))
+        screen.blit(self.panel, (10, 10))
         
         # Title
-        title = self.font.render("POWER-UP TEST MODE", True, COLOR_YELLOW)
+        title = text_cache.render("POWER-UP TEST MODE", self.font_size, COLOR_YELLOW)
         screen.blit(title, (20, 20))
         
         # Instructions
@@ -102,12 +108,12 @@ class PowerUpTestMode:
         ]
         
         for i, instruction in enumerate(instructions):
-            text = self.small_font.render(instruction, True, COLOR_WHITE)
+            text = text_cache.render(instruction, self.small_font_size, COLOR_WHITE)
             screen.blit(text, (20, 50 + i * 20))
             
         # Power-up list
         list_start_y = 170
-        screen.blit(self.font.render("Power-ups:", True, COLOR_YELLOW), (20, list_start_y))
+        screen.blit(text_cache.render("Power-ups:", self.font_size, COLOR_YELLOW), (20, list_start_y))
         
         for i, powerup_type in enumerate(self.powerup_list):
             y_pos = list_start_y + 30 + i * 18
@@ -119,12 +125,12 @@ class PowerUpTestMode:
                 
             # Power-up name
             name = powerup_type.value.replace('_', ' ').title()
-            text = self.small_font.render(f"{i+1:2d}. {name}", True, color)
+            text = text_cache.render(f"{i+1:2d}. {name}", self.small_font_size, color)
             screen.blit(text, (20, y_pos))
             
         # Active power-ups count
         active_count = len([p for p in self.powerup_manager.powerups if p.is_active()])
-        count_text = self.small_font.render(f"Active: {active_count}", True, COLOR_GRAY)
+        count_text = text_cache.render(f"Active: {active_count}", self.small_font_size, COLOR_GRAY)
         screen.blit(count_text, (20, 380))
         
     def draw_help_hint(self, screen):
@@ -132,14 +138,14 @@ class PowerUpTestMode:
         if self.active:
             return
             
-        hint_text = self.small_font.render("Press T for Power-up Test Mode", True, COLOR_GRAY)
+        hint_text = text_cache.render("Press T for Power-up Test Mode", self.small_font_size, COLOR_GRAY)
         screen.blit(hint_text, (10, SCREEN_HEIGHT - 25))
 
 class PowerUpInfoDisplay:
     def __init__(self, assets):
         self.assets = assets
-        self.font = pygame.font.Font(None, 20)
-        self.small_font = pygame.font.Font(None, 16)
+        self.font_size = 20
+        self.small_font_size = 16
         
     def draw_powerup_info(self, screen, powerup_manager):
         """Draw detailed info about power-ups on screen"""
@@ -160,7 +166,7 @@ class PowerUpInfoDisplay:
                 
             # Power-up name
             name = powerup.type.value.replace('_', ' ').title()
-            name_text = self.small_font.render(name, True, COLOR_WHITE)
+            name_text = text_cache.render(name, self.small_font_size, COLOR_WHITE)
             
             # Background for text
             text_rect = name_text.get_rect()
@@ -194,12 +200,12 @@ class PowerUpInfoDisplay:
         pygame.draw.rect(screen, COLOR_WHITE, bg_rect, 1)
         
         # Title
-        title = self.font.render("Power-up Effects:", True, COLOR_YELLOW)
+        title = text_cache.render("Power-up Effects:", self.font_size, COLOR_YELLOW)
         screen.blit(title, (start_x, start_y))
         
         # Effects
         for i, (powerup_type, description) in enumerate(descriptions.items()):
             y_pos = start_y + 25 + i * 16
             name = powerup_type.value.replace('_', ' ').title()
-            text = self.small_font.render(f"{name}: {description}", True, COLOR_WHITE)
+            text = text_cache.render(f"{name}: {description}", self.small_font_size, COLOR_WHITE)
             screen.blit(text, (start_x, y_pos))
\ No newline at end of file
@@ -0,0 +1,167 @@
+# Offline profiling of a seeded, scripted game session
+# Runs N frames headless under cProfile (pstats per game state and wave) and a sampling
+# profiler (collapsed stacks for flame-graph tools such as flamegraph.pl or speedscope)
+# Usage: python profile_game.py [--frames N] [--seed S] [--output-dir DIR]
+
+import argparse
+import cProfile
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+import pygame
+from game import Game
+from game_states import GameState
+from settings import SIMULATION_HZ
+
+# Scripted input, in frames
+MENU_FRAMES = 120  # Idle on the menu before starting
+STRAFE_FRAMES = 90  # Hold right, then left, for this long each
+PAUSE_EVERY = 1200  # Pause for PAUSE_FRAMES once per this many playing frames
+PAUSE_FRAMES = 120
+
+def scripted_keys(frame):
+    """Get the held keys for a playing frame: strafe back and forth while firing"""
+    keys = defaultdict(bool)
+    keys[pygame.K_SPACE] = True
+    keys[pygame.K_RIGHT if (frame // STRAFE_FRAMES) % 2 == 0 else pygame.K_LEFT] = True
+    return keys
+
+def get_tag(game):
+    """Label the current frame with the game state and, outside the menu, the wave number"""
+    if game.state == GameState.MENU:
+        return game.state.name
+    # Tags are set before the frame runs: right after a reset there is no wave yet,
+    # and this frame's update starts wave 1
+    wave_manager = game.wave_manager
+    wave_number = wave_manager.wave_number if wave_manager.current_wave else wave_manager.wave_number + 1
+    return f"{game.state.name};wave {wave_number}"
+
+class StackSampler:
+    def __init__(self, interval):
+        """
+        Samples the main thread's Python stack from a background thread
+        Each sample is counted under the tag the main thread set for its current frame
+        """
+        self.interval = interval
+        self.thread_id = threading.main_thread().ident
+        self.tag = "startup"
+        self.counts = Counter()  # "tag;outermost;...;innermost" -> samples
+        self.tag_counts = Counter()  # tag -> samples
+        self.running = False
+        self.thread = None
+        
+    def start(self):
+        """Start sampling in a daemon thread"""
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        
+    def stop(self):
+        """Stop sampling and wait for the thread to finish"""
+        self.running = False
+        self.thread.join()
+        
+    def _run(self):
+        while self.running:
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                tag = self.tag
+                self.counts[";".join([tag] + stack[::-1])] += 1
+                self.tag_counts[tag] += 1
+            time.sleep(self.interval)
+            
+    def write_collapsed(self, path):
+        """Write one "stack count" line per unique stack (Brendan Gregg's collapsed format)"""
+        with open(path, "w") as f:
+            for stack, count in sorted(self.counts.items()):
+                f.write(f"{stack} {count}\n")
+
+def run_session(frames, seed, sampler):
+    """Play a scripted session; returns a cProfile profile per frame tag"""
+    random.seed(seed)  # The game seeds its own NumPy generators from this
+    game = Game(headless=True)
+    step = 1000 / SIMULATION_HZ
+    profiles = {}
+    playing_frames = 0
+    next_pause = PAUSE_EVERY
+    pause_left = 0
+    
+    for frame in range(frames):
+        pygame.event.pump()
+        
+        # Scripted state changes: menu, then play with periodic pauses, restarting after game over
+        if game.state == GameState.MENU and frame >= MENU_FRAMES:
+            game.reset_game()
+        elif game.state == GameState.GAME_OVER:
+            game.reset_game()
+        elif game.state == GameState.PLAYING and playing_frames >= next_pause:
+            game.state = GameState.PAUSED
+            pause_left = PAUSE_FRAMES
+            next_pause += PAUSE_EVERY
+        elif game.state == GameState.PAUSED:
+            pause_left -= 1
+            if pause_left <= 0:
+                game.state = GameState.PLAYING
+                
+        tag = get_tag(game)
+        sampler.tag = tag
+        profile = profiles.get(tag)
+        if profile is None:
+            profile = profiles[tag] = cProfile.Profile()
+            
+        profile.enable()
+        game.game_clock.tick(step)
+        game.update(step, scripted_keys(playing_frames))
+        game.draw()
+        profile.disable()
+        
+        if game.state == GameState.PLAYING:
+            playing_frames += 1
+    pygame.quit()
+    return profiles
+
+def write_reports(profiles, sampler, output_dir):
+    """Write combined and per-tag pstats files plus the collapsed stacks; returns the combined stats"""
+    os.makedirs(output_dir, exist_ok=True)
+    for tag, profile in profiles.items():
+        name = tag.replace(";", "_").replace(" ", "").lower()
+        profile.dump_stats(os.path.join(output_dir, f"{name}.pstats"))
+        
+    combined = pstats.Stats(*profiles.values())
+    combined.dump_stats(os.path.join(output_dir, "combined.pstats"))
+    sampler.write_collapsed(os.path.join(output_dir, "stacks.collapsed"))
+    return combined
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile a seeded, scripted Space Invaders session")
+    parser.add_argument("--frames", type=int, default=3600, help="frames to run (default: 3600)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed (default: 1)")
+    parser.add_argument("--interval", type=float, default=1.0, help="stack sampling interval in ms (default: 1)")
+    parser.add_argument("--output-dir", default="profile_output", help="directory for the profile files")
+    parser.add_argument("--top", type=int, default=25, help="functions to print by cumulative time")
+    args = parser.parse_args()
+    
+    sampler = StackSampler(args.interval / 1000)
+    sampler.start()
+    try:
+        profiles = run_session(args.frames, args.seed, sampler)
+    finally:
+        sampler.stop()
+        
+    combined = write_reports(profiles, sampler, args.output_dir)
+    combined.sort_stats("cumulative").print_stats(args.top)
+    
+    # Where the time went, per state and wave
+    total = sum(sampler.tag_counts.values()) or 1
+    for tag, count in sampler.tag_counts.most_common():
+        print(f"{tag:<24} {count:7d} samples {count / total:6.1%}")
+    print(f"Profiles written to {args.output_dir}/ (per-tag and combined .pstats, stacks.collapsed)")
\ No newline at end of file
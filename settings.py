@@ -3,7 +3,13 @@
 # Screen settings
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60  # Render rate cap
+IDLE_FPS = 10  # Loop rate while paused or on the game-over screen, where the frame is frozen
+ATLAS_MAX_WIDTH = 1024  # Sprite atlas width; sprites wrap onto new shelves below
+
+# Simulation settings
+SIMULATION_HZ = 60  # Fixed simulation step rate, independent of the render rate
+MAX_FRAME_TIME = 250  # ms, clamps the accumulator after a stall to avoid a spiral of death
 
 # Player settings
 PLAYER_SPEED = 8.0  # Fine-tuned for responsive but controlled movement
@@ -14,6 +20,8 @@ PLAYER_SIZE = (40, 40)
 # Bullet settings
 BULLET_SPEED = 18.0  # Adjusted for 60 FPS (0.3 * 60)
 BULLET_SIZE = (15, 15)
+PLAYER_BULLET_CAPACITY = 64  # Initial pool sizes; pools grow when full
+ENEMY_BULLET_CAPACITY = 512
 
 # Enemy settings
 ENEMY_SIZE = (45, 45)
@@ -36,17 +44,24 @@ EVASION_REACTION_TIME = 800  # ms before enemies can evade again
 FLANKING_DISTANCE_MIN = 100  # Minimum flanking distance
 FLANKING_DISTANCE_MAX = 250  # Maximum flanking distance
 SWARM_COORDINATION_RANGE = 150  # Distance for enemy coordination
+ENEMY_MOVEMENT_BACKEND = "vectorized"  # "vectorized" (EnemyMovementEngine) or "scalar" (Enemy.update)
 
 # Background settings
 BG_SPEED_INITIAL = 6.0  # Adjusted for 60 FPS (0.1 * 60)
 BG_SPEED_MAX = 24.0     # Adjusted for 60 FPS (0.4 * 60)
 BG_SPEED_INCREASE_RATE = 100000  # Time factor for speed increase
 
+# Effects settings
+PARTICLE_CAPACITY = 2048  # Explosion particles; the oldest are overwritten when full
+PARTICLE_ALPHA_BUCKETS = 8  # Fade levels pre-rendered per particle color and size
+POWERUP_SIZE = 20  # Power-up radius before pulsing (sprites are cached per pulse size)
+
 # Game mechanics
 STARTING_LIVES = 5
 COLLISION_THRESHOLD_BULLET = 27
 COLLISION_THRESHOLD_SHIP = 40
 COLLISION_THRESHOLD_PLAYER_BULLET = 30
+COLLISION_BACKEND = "scalar"  # "scalar" (spatial hash) or "numpy" (vectorized kernel)
 
 # Scoring
 SCORE_ENEMY_KILL = 100
@@ -73,4 +88,16 @@ COLOR_BLACK = (0, 0, 0)
 # Font sizes
 FONT_SIZE_HUD = 24
 FONT_SIZE_GAME_OVER = 64
-FONT_SIZE_SMALL = 36
\ No newline at end of file
+FONT_SIZE_SMALL = 36
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept by the shared text cache
+
+# Profiler settings
+PROFILER_HISTORY = 240  # Timing samples kept per phase
+PROFILER_REFRESH_FRAMES = 15  # Frames between overlay text updates, so it stays readable
+FONT_SIZE_PROFILER = 18
+
+# Memory diagnostics settings
+MEMORY_TRACE_FRAMES = 1  # Traceback depth kept by tracemalloc; growth is reported per file and line
+MEMORY_REPORT_TOP = 10  # Lines with the largest growth listed per wave
+MEMORY_LEAK_WAVES = 3  # Consecutive waves a counter or line must grow for to count as a leak
+MEMORY_LEAK_MIN_BYTES = 64 * 1024  # Smaller steadily growing lines are ignored
\ No newline at end of file
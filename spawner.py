@@ -1,12 +1,26 @@
 import random
 from enemy import Enemy
-from settings import ENEMY_MIN_SPACING, ENEMY_SPAWN_SCORE_3RD, ENEMY_SPAWN_SCORE_4TH
+from enemy_engine import EnemyMovementEngine
+from collision import NeighborIndex
+from settings import (
+    ENEMY_MIN_SPACING, ENEMY_SPAWN_SCORE_3RD, ENEMY_SPAWN_SCORE_4TH, ENEMY_MOVEMENT_BACKEND
+)
 
 class EnemySpawner:
-    def __init__(self):
+    def __init__(self, movement_backend=ENEMY_MOVEMENT_BACKEND):
         self.enemies = []
         self.existing_positions = []
         
+        # Vectorized movement engine, or None to use the scalar Enemy.update path
+        self.engine = EnemyMovementEngine() if movement_backend == "vectorized" else None
+        self.neighbor_index = NeighborIndex()  # Scalar path swarm coordination
+        
+    def _add_enemy(self, enemy):
+        """Start tracking a new enemy"""
+        self.enemies.append(enemy)
+        if self.engine:
+            self.engine.add(enemy)
+            
     def spawn_enemy(self, ai_level=0):
         """Spawn a new enemy with proper spacing and AI level"""
         attempts = 0
@@ -16,7 +30,7 @@ class EnemySpawner:
             if not too_close:
                 self.existing_positions.append(base_x)
                 enemy = Enemy(base_x, ai_level)
-                self.enemies.append(enemy)
+                self._add_enemy(enemy)
                 return enemy
             attempts += 1
             
@@ -24,17 +38,25 @@ class EnemySpawner:
         fallback_x = random.randint(100, 700)
         self.existing_positions.append(fallback_x)
         enemy = Enemy(fallback_x, ai_level)
-        self.enemies.append(enemy)
+        self._add_enemy(enemy)
         return enemy
         
     def update_enemies(self, delta_time, current_time, player_x, bg_speed):
         """Update all enemies"""
-        # Get list of all enemies for coordination
-        all_enemies = [e for e in self.enemies if e.is_visible()]
+        if self.engine:
+            for enemy in self.engine.update(delta_time, current_time, player_x, bg_speed):
+                self.remove_enemy(enemy)
+                ai_level = getattr(self, 'current_ai_level', 0)
+                self.spawn_enemy(ai_level)  # Replace destroyed enemy
+            return
+            
+        # Sorted-by-x index of start-of-frame positions for swarm coordination
+        visible = [e for e in self.enemies if e.is_visible()]
+        self.neighbor_index.rebuild([e.base_x for e in visible], visible)
         
         # Update existing enemies
         for enemy in self.enemies[:]:  # Use slice to avoid modification during iteration
-            enemy.update(delta_time, current_time, player_x, bg_speed, all_enemies)
+            enemy.update(delta_time, current_time, player_x, bg_speed, self.neighbor_index)
             if not enemy.is_visible():
                 self.remove_enemy(enemy)
                 # Calculate AI level based on current game state (can be passed from game)
@@ -44,12 +66,14 @@ class EnemySpawner:
     def remove_enemy(self, enemy):
         """Remove an enemy and update positions list"""
         if enemy in self.enemies:
-            # Remove from position tracking
-            enemy_x = enemy.base_x
+            # Remove from position tracking (recorded at spawn, before the enemy moved)
+            enemy_x = enemy.original_base_x
             if enemy_x in self.existing_positions:
                 self.existing_positions.remove(enemy_x)
             # Remove from enemies list
             self.enemies.remove(enemy)
+            if self.engine:
+                self.engine.remove(enemy)
             
     def get_enemies(self):
         """Get all active enemies"""
@@ -69,16 +93,19 @@ class EnemySpawner:
         for _ in range(count):
             self.spawn_enemy(ai_level)
             
-    def spawn_enemy_at_position(self, x, y, ai_level=0):
-        """Spawn enemy at specific position (for wave system)"""
+    def spawn_enemy_at_position(self, x, y, ai_level=0, movement_type=None):
+        """Spawn enemy at specific position (for wave system); movement_type overrides the AI level's choice"""
         from enemy import Enemy
-        enemy = Enemy(x, ai_level)
+        enemy = Enemy(x, ai_level, movement_type)
         enemy.y = y  # Override the random Y position
-        self.enemies.append(enemy)
+        enemy.prev_y = y
+        self._add_enemy(enemy)
         self.existing_positions.append(x)
         return enemy
         
     def clear_all(self):
         """Clear all enemies"""
         self.enemies.clear()
-        self.existing_positions.clear()
\ No newline at end of file
+        self.existing_positions.clear()
+        if self.engine:
+            self.engine.clear()
\ No newline at end of file
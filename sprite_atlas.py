@@ -0,0 +1,51 @@
+import pygame
+from settings import ATLAS_MAX_WIDTH
+
+class SpriteAtlas:
+    def __init__(self, max_width=ATLAS_MAX_WIDTH, padding=1):
+        """
+        Packs named sprites into one surface so draws can batch blits from a single source
+        Sprites are placed on shelves, tallest first, left to right
+        """
+        self.max_width = max_width
+        self.padding = padding  # Transparent gap so scaled/filtered neighbours never bleed
+        self.surface = None
+        self.rects = {}  # name -> area of the sprite within the atlas surface
+        
+    def __contains__(self, name):
+        return name in self.rects
+        
+    def pack(self, sprites):
+        """Build the atlas from a dict of name -> surface (the display mode must already be set)"""
+        padding = self.padding
+        order = sorted(sprites, key=lambda name: sprites[name].get_height(), reverse=True)
+        
+        # Shelf packing: fill a row, then start a new one below its tallest sprite
+        positions = {}
+        x = y = shelf_height = width = 0
+        for name in order:
+            sprite_width, sprite_height = sprites[name].get_size()
+            if x and x + sprite_width > self.max_width:
+                x = 0
+                y += shelf_height + padding
+                shelf_height = 0
+            positions[name] = (x, y)
+            x += sprite_width + padding
+            width = max(width, x)
+            shelf_height = max(shelf_height, sprite_height)
+            
+        self.surface = pygame.Surface((max(width, 1), max(y + shelf_height, 1)), pygame.SRCALPHA).convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self.rects = {}
+        for name, position in positions.items():
+            # BLEND_RGBA_MAX onto transparent pixels copies the sprite's colour and alpha exactly
+            self.surface.blit(sprites[name], position, special_flags=pygame.BLEND_RGBA_MAX)
+            self.rects[name] = pygame.Rect(position, sprites[name].get_size())
+            
+    def get_rect(self, name):
+        """Get the area of a sprite within the atlas surface"""
+        return self.rects[name]
+        
+    def subsurface(self, name):
+        """Get a sprite as a surface sharing the atlas pixels"""
+        return self.surface.subsurface(self.rects[name])
\ No newline at end of file
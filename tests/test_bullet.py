@@ -0,0 +1,60 @@
+from bullet import BulletPool
+from settings import SCREEN_HEIGHT
+
+def make_pool(capacity=4):
+    """Upward-moving pool, like the player's"""
+    return BulletPool(capacity, direction=1, draw_offset=(0, 0))
+
+def test_released_slot_and_handle_are_reused():
+    """A released slot goes back on the free list and is the next one handed out"""
+    pool = make_pool()
+    bullets = [pool.spawn(100, 300, 5) for _ in range(3)]
+    assert [bullet.index for bullet in bullets] == [0, 1, 2]  # Lowest free index first
+    
+    bullets[1].deactivate()
+    bullets[1].deactivate()  # Releasing twice must not free the slot twice
+    assert pool.active_count == 2
+    assert pool.spawn(200, 300, 5) is bullets[1]
+    assert pool.spawn(200, 300, 5).index == 3
+
+def test_pool_grows_keeping_active_bullets():
+    """Spawning past capacity doubles the pool without moving existing bullets"""
+    pool = make_pool(capacity=2)
+    first = pool.spawn(10, 300, 5)
+    pool.spawn(20, 300, 5)
+    third = pool.spawn(30, 300, 5)
+    assert pool.capacity == 4
+    assert third.index == 2
+    assert first.get_position() == (10.0, 300.0)
+    assert pool.active_count == 3
+
+def test_off_screen_bullets_are_freed():
+    """Bullets leaving the screen are deactivated and their slots reused"""
+    pool = make_pool()
+    leaving = pool.spawn(100, 3, 5)
+    staying = pool.spawn(100, SCREEN_HEIGHT / 2, 5)
+    pool.update(16.67)
+    assert not leaving.is_active()
+    assert staying.is_active()
+    assert pool.active_count == 1
+    assert pool.spawn(100, 300, 5) is leaving
+
+def test_view_is_in_firing_order():
+    """Views list bullets by firing order even when slots were reused out of order"""
+    pool = make_pool()
+    a, b, c = (pool.spawn(x, 300, 5) for x in (1, 2, 3))
+    a.deactivate()
+    d = pool.spawn(4, 300, 5)  # Reuses slot 0
+    assert d.index == 0
+    assert list(pool.view()) == [b, c, d]
+    assert pool.view().positions().tolist() == [[2.0, 300.0], [3.0, 300.0], [4.0, 300.0]]
+
+def test_clear_frees_every_slot():
+    """After clear, slots are handed out from the lowest index again"""
+    pool = make_pool()
+    for _ in range(3):
+        pool.spawn(100, 300, 5)
+    pool.clear()
+    assert pool.active_count == 0
+    assert len(pool.view()) == 0
+    assert pool.spawn(100, 300, 5).index == 0
\ No newline at end of file
@@ -0,0 +1,74 @@
+import random
+import numpy as np
+from collision import NeighborIndex, find_bullet_enemy_hits, find_enemy_enemy_pairs
+from settings import COLLISION_THRESHOLD_BULLET, COLLISION_THRESHOLD_SHIP
+
+def scalar_bullet_enemy_hits(bullet_positions, enemy_positions, threshold=COLLISION_THRESHOLD_BULLET):
+    """The scalar loop the kernel replaces: each bullet takes the first untaken enemy it overlaps"""
+    hits = []
+    taken = set()
+    for b, (bullet_x, bullet_y) in enumerate(bullet_positions):
+        for e, (enemy_x, enemy_y) in enumerate(enemy_positions):
+            if e not in taken and (bullet_x - enemy_x) ** 2 + (bullet_y - enemy_y) ** 2 < threshold ** 2:
+                taken.add(e)
+                hits.append((b, e))
+                break
+    return hits
+
+def test_first_overlapping_enemy_wins_and_each_enemy_is_hit_once():
+    """Two bullets over the same two enemies hit one each, in array order"""
+    bullets = np.array([[100.0, 100.0], [100.0, 100.0], [100.0, 100.0], [400.0, 400.0]])
+    enemies = np.array([[110.0, 100.0], [95.0, 100.0], [700.0, 100.0]])
+    assert find_bullet_enemy_hits(bullets, enemies) == [(0, 0), (1, 1)]
+
+def test_threshold_is_exclusive():
+    """A bullet exactly the threshold away misses"""
+    bullets = np.array([[0.0, 0.0]])
+    assert find_bullet_enemy_hits(bullets, np.array([[COLLISION_THRESHOLD_BULLET, 0.0]])) == []
+    assert find_bullet_enemy_hits(bullets, np.array([[COLLISION_THRESHOLD_BULLET - 0.5, 0.0]])) == [(0, 0)]
+
+def test_empty_inputs():
+    """No bullets or no enemies means no hits"""
+    assert find_bullet_enemy_hits(np.zeros((0, 2)), np.array([[1.0, 1.0]])) == []
+    assert find_bullet_enemy_hits(np.array([[1.0, 1.0]]), np.zeros((0, 2))) == []
+
+def test_matches_scalar_loop():
+    """Crowded random layouts give the same pairs as the scalar loop"""
+    rng = random.Random(5)
+    for _ in range(50):
+        bullets = np.array([[rng.uniform(0, 200), rng.uniform(0, 200)] for _ in range(rng.randint(0, 30))]).reshape(-1, 2)
+        enemies = np.array([[rng.uniform(0, 200), rng.uniform(0, 200)] for _ in range(rng.randint(0, 20))]).reshape(-1, 2)
+        assert find_bullet_enemy_hits(bullets, enemies) == scalar_bullet_enemy_hits(bullets.tolist(), enemies.tolist())
+
+def test_neighbor_index_counts_others_within_range():
+    """count_and_sum minus the querying position itself matches a scan over the others"""
+    rng = random.Random(8)
+    xs = [rng.uniform(0, 800) for _ in range(60)] + [300.0, 300.0, 450.0]  # Shared and exactly-at-range positions
+    index = NeighborIndex()
+    index.rebuild(xs)
+    for i, x in enumerate(xs):
+        others = [other for j, other in enumerate(xs) if j != i and abs(other - x) < 150]
+        count, total = index.count_and_sum(x, 150)
+        assert count - 1 == len(others)
+        assert abs((total - x) - sum(others)) < 1e-6
+
+def test_neighbor_index_array_queries_and_objects():
+    """Array queries match scalar ones, and nearby returns the objects ordered by position"""
+    index = NeighborIndex()
+    index.rebuild([30.0, 10.0, 20.0, 100.0], ["c", "a", "b", "d"])
+    counts, totals = index.count_and_sum(np.array([20.0, 100.0]), np.array([15.0, 5.0]))
+    assert counts.tolist() == [3, 1]
+    assert totals.tolist() == [60.0, 100.0]
+    assert index.nearby(20.0, 10.0) == ["b"]  # 10 and 30 are exactly at the range, so excluded
+    assert index.nearby(25.0, 10.0) == ["b", "c"]
+
+def test_enemy_pairs_match_nested_loop():
+    """Sweep-and-prune finds the same (i, j) pairs, in the same order, as the nested i/j loop"""
+    rng = random.Random(9)
+    for _ in range(50):
+        # Rounded coordinates give shared x values and pairs exactly at the threshold
+        positions = [(float(rng.randint(0, 20) * 10), float(rng.randint(0, 20) * 10)) for _ in range(rng.randint(0, 40))]
+        expected = [(i, j) for i in range(len(positions)) for j in range(i + 1, len(positions))
+                    if (positions[i][0] - positions[j][0]) ** 2 + (positions[i][1] - positions[j][1]) ** 2
+                    < COLLISION_THRESHOLD_SHIP ** 2]
+        assert find_enemy_enemy_pairs(positions) == expected
\ No newline at end of file
@@ -0,0 +1,16 @@
+import random
+from spawner import EnemySpawner
+
+def test_removed_enemies_release_their_spawn_position():
+    """Positions are released by spawn x even after the enemy has moved"""
+    random.seed(1)
+    spawner = EnemySpawner(movement_backend="scalar")
+    enemies = [spawner.spawn_enemy() for _ in range(5)]
+    enemies.append(spawner.spawn_enemy_at_position(400, 100))
+    assert len(spawner.existing_positions) == len(spawner.enemies) == 6
+    
+    for enemy in enemies:
+        enemy.base_x += 37  # Movement patterns change base_x
+        spawner.remove_enemy(enemy)
+    assert spawner.existing_positions == []
+    assert spawner.enemies == []
\ No newline at end of file
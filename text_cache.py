@@ -0,0 +1,71 @@
+import pygame
+from collections import OrderedDict
+from settings import TEXT_CACHE_SIZE
+
+class FontRegistry:
+    """Shared pygame fonts, created once per (font name, size)"""
+    def __init__(self):
+        self.fonts = {}
+        
+    def get(self, size, name=None):
+        """Get the font for a size (name None is pygame's default font)"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+        
+    def clear(self):
+        """Forget all fonts (e.g. after pygame.font.quit)"""
+        self.fonts.clear()
+
+class TextRenderCache:
+    def __init__(self, fonts, max_size=TEXT_CACHE_SIZE):
+        """
+        LRU cache of rendered text surfaces keyed by (font, size, text, color)
+        Cached surfaces are shared, so callers must never modify them
+        """
+        self.fonts = fonts
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        
+    def render(self, text, size, color, alpha=None, name=None):
+        """Get the surface for a string; alpha bakes a surface-wide transparency into the cached copy"""
+        key = (name, size, text, color, alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+            
+        self.misses += 1
+        surface = self.fonts.get(size, name).render(text, True, color)
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)  # Evict the least recently used
+        return surface
+        
+    def get_stats(self):
+        """Get hit/miss counters for profiling"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.surfaces),
+            "hit_rate": self.hits / total if total else 0.0
+        }
+        
+    def clear(self):
+        """Drop all cached surfaces and reset the counters"""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+# Shared by every system that draws text
+fonts = FontRegistry()
+text_cache = TextRenderCache(fonts)
\ No newline at end of file
@@ -133,7 +133,8 @@ class Wave:
         return self.enemies_killed / self.enemy_count
 
 class WaveManager:
-    def __init__(self):
+    def __init__(self, on_wave_start=None):
+        self.on_wave_start = on_wave_start  # Optional callback taking the new wave number
         self.current_wave = None
         self.wave_number = 0
         self.transition_start_time = 0
@@ -145,6 +146,8 @@ class WaveManager:
         self.wave_number += 1
         self.current_wave = Wave(self.wave_number)
         self.in_transition = False
+        if self.on_wave_start:
+            self.on_wave_start(self.wave_number)
         
     def update(self, current_time):
         """Update wave state"""